@@ -1,6 +1,6 @@
 """Entry point for python -m workgarden."""
 
-from workgarden.cli.app import app
+from workgarden.cli.entry import run
 
 if __name__ == "__main__":
-    app()
+    run()
@@ -1,29 +1,93 @@
 """Main Typer application."""
 
+import importlib
+
+import click
 import typer
+from typer.core import TyperCommand, TyperGroup
+
+from workgarden.cli.entry import APP_HELP, COMMANDS, get_version_string
+
+
+def _load_command(name: str) -> click.Command:
+    """Import a subcommand module and build its click command."""
+    module_path, attr, _ = COMMANDS[name]
+    target = getattr(importlib.import_module(module_path), attr)
+
+    if isinstance(target, typer.Typer):
+        command: click.Command = typer.main.get_group(target)
+    else:
+        single = typer.Typer(add_completion=False)
+        single.command(name=name)(target)
+        command = typer.main.get_command(single)
+
+    command.name = name
+    return command
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports subcommand modules on first use.
+
+    Commands come from the static COMMANDS registry, so `wg --help` never pulls
+    in config loading, pydantic, or the YAML libraries.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._formatting_help = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return list(COMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.commands or cmd_name not in COMMANDS:
+            return self.commands.get(cmd_name)
+
+        if self._formatting_help:
+            # Top-level help only needs names and short help - don't import anything
+            return TyperCommand(name=cmd_name, help=COMMANDS[cmd_name][2])
+
+        self.commands[cmd_name] = _load_command(cmd_name)
+        return self.commands[cmd_name]
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
 
-from workgarden.cli.commands import config, create, remove
-from workgarden.cli.commands import list as list_cmd
-from workgarden.cli.commands import open as open_cmd
 
 app = typer.Typer(
     name="workgarden",
-    help="Git worktree manager with Docker Compose support.",
+    help=APP_HELP,
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
-app.add_typer(config.app, name="config")
-app.command(name="create")(create.create)
-app.command(name="remove")(remove.remove)
-app.command(name="list")(list_cmd.list_worktrees)
-app.command(name="open")(open_cmd.open_worktree)
+
+def _version_callback(value: bool) -> None:
+    if value:
+        typer.echo(get_version_string())
+        raise typer.Exit()
 
 
 @app.callback()
-def main() -> None:
+def main(
+    version: bool = typer.Option(
+        False,
+        "--version",
+        "-V",
+        callback=_version_callback,
+        is_eager=True,
+        help="Show version and exit.",
+    ),
+) -> None:
     """Workgarden - Git worktree manager."""
     pass
 
 
 if __name__ == "__main__":
-    app()
+    from workgarden.cli.entry import run
+
+    run()
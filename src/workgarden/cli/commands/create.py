@@ -2,9 +2,9 @@
 
 import typer
 
-from workgarden.config.loader import ConfigLoader
+from workgarden.cli.common import require_config
 from workgarden.core.worktree import CreateOptions, WorktreeManager
-from workgarden.exceptions import ConfigNotFoundError, EditorError, RootDetectionError
+from workgarden.exceptions import EditorError
 from workgarden.utils.console import (
     OperationProgressReporter,
     console,
@@ -31,22 +31,15 @@ def create(
 ) -> None:
     """Create a new worktree."""
     # Verify config exists
-    try:
-        config_loader = ConfigLoader()
-        config = config_loader.load()
-    except RootDetectionError:
-        print_error("Not in a git repository")
-        raise typer.Exit(1)
-    except ConfigNotFoundError:
-        print_error("No .workgarden.yaml found in main repository. Run 'wg config init' first.")
-        raise typer.Exit(1)
+    config = require_config()
 
     # Show dry-run banner if applicable
     if dry_run:
         print_dry_run_banner()
 
     # Create manager with progress callback
-    manager = WorktreeManager(progress_callback=OperationProgressReporter())
+    reporter = OperationProgressReporter()
+    manager = WorktreeManager(progress_callback=reporter)
 
     # Build options
     options = CreateOptions(
@@ -60,7 +53,10 @@ def create(
 
     # Execute
     console.print(f"Creating worktree for branch: [cyan]{branch}[/cyan]")
-    result = manager.create(options)
+    try:
+        result = manager.create(options)
+    finally:
+        reporter.flush()
 
     if result.success:
         if dry_run:
@@ -1,73 +1,76 @@
 """List command for worktree management."""
 
 import json
+import sys
 
 import typer
 
-from workgarden.config.loader import ConfigLoader
+from workgarden.cli.common import require_config
 from workgarden.core.worktree import WorktreeManager
-from workgarden.exceptions import ConfigNotFoundError, RootDetectionError
-from workgarden.utils.console import console, create_table, print_error, print_info
 
 app = typer.Typer()
 
+TABLE_COLUMNS = [
+    {"name": "Branch", "style": "cyan", "no_wrap": True},
+    {"name": "Path", "style": "dim"},
+    {"name": "Ports", "justify": "center"},
+    {"name": "Status", "justify": "center", "no_wrap": True},
+]
+
+# Status -> styled label with color and icon
+STATUS_STYLES = {
+    "OK": "[green]● OK[/green]",
+    "Missing": "[red]✗ Missing[/red]",
+    "Modified": "[yellow]◐ Modified[/yellow]",
+}
+
+
+def _dumps_json(data: dict) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
 
 @app.callback(invoke_without_command=True)
 def list_worktrees(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     """List all managed worktrees."""
+    # Rich is only imported for table output and errors - `--json` never needs it
     # Verify config exists
-    try:
-        config_loader = ConfigLoader()
-        config_loader.load()
-    except RootDetectionError:
-        print_error("Not in a git repository")
-        raise typer.Exit(1)
-    except ConfigNotFoundError:
-        print_error("No .workgarden.yaml found in main repository. Run 'wg config init' first.")
-        raise typer.Exit(1)
+    require_config()
 
     # Create manager and list worktrees
     manager = WorktreeManager()
-    worktrees = manager.list()
+    worktrees = manager.list_with_status()
 
     if not worktrees:
         if json_output:
-            print("{}")
+            sys.stdout.write("{}\n")
         else:
+            from workgarden.utils.console import print_info
+
             print_info("No worktrees found")
         return
 
     if json_output:
-        # JSON output mode - use print() to avoid Rich wrapping
-        output = {}
-        for slug, wt in worktrees.items():
-            status = manager.get_worktree_status(wt)
-            data = wt.model_dump_json_compatible()
-            data["status"] = status
-            output[slug] = data
-        print(json.dumps(output, indent=2))
+        # JSON output mode - plain stdout to avoid Rich wrapping
+        output = {
+            slug: {**wt.to_dict(), "status": status} for slug, (wt, status) in worktrees.items()
+        }
+        sys.stdout.write(_dumps_json(output) + "\n")
     else:
-        # Table output mode with styled columns
-        columns = [
-            {"name": "Branch", "style": "cyan", "no_wrap": True},
-            {"name": "Path", "style": "dim"},
-            {"name": "Ports", "justify": "center"},
-            {"name": "Status", "justify": "center", "no_wrap": True},
-        ]
-        table = create_table("Managed Worktrees", columns)
+        from workgarden.utils.console import console, create_table
 
-        for _slug, wt in worktrees.items():
-            status = manager.get_worktree_status(wt)
+        # Table output mode with styled columns
+        table = create_table("Managed Worktrees", TABLE_COLUMNS)
 
+        for wt, status in worktrees.values():
             # Format status with color and icon
-            status_styles = {
-                "OK": "[green]● OK[/green]",
-                "Missing": "[red]✗ Missing[/red]",
-                "Modified": "[yellow]◐ Modified[/yellow]",
-            }
-            status_str = status_styles.get(status, status)
+            status_str = STATUS_STYLES.get(status, status)
 
             # Format ports
             if wt.port_mappings:
@@ -2,9 +2,8 @@
 
 import typer
 
-from workgarden.config.loader import ConfigLoader
+from workgarden.cli.common import require_config
 from workgarden.core.worktree import RemoveOptions, WorktreeManager
-from workgarden.exceptions import ConfigNotFoundError, RootDetectionError
 from workgarden.utils.console import (
     OperationProgressReporter,
     console,
@@ -12,7 +11,6 @@ from workgarden.utils.console import (
     print_success,
     print_warning,
 )
-from workgarden.utils.git import get_branch_slug
 
 app = typer.Typer()
 
@@ -27,35 +25,19 @@ def remove(
 ) -> None:
     """Remove a worktree."""
     # Verify config exists
-    try:
-        config_loader = ConfigLoader()
-        config_loader.load()
-    except RootDetectionError:
-        print_error("Not in a git repository")
-        raise typer.Exit(1)
-    except ConfigNotFoundError:
-        print_error("No .workgarden.yaml found in main repository. Run 'wg config init' first.")
-        raise typer.Exit(1)
+    require_config()
 
     # Create manager
     manager = WorktreeManager()
 
     # Find worktree
-    slug = get_branch_slug(branch)
-    worktree = manager.state.get_worktree(slug)
-
-    if not worktree:
-        # Try to find by exact branch match
-        for s, wt in manager.list().items():
-            if wt.branch == branch:
-                slug = s
-                worktree = wt
-                break
-
-    if not worktree:
+    found = manager.find_by_branch(branch)
+    if not found:
         print_error(f"Worktree not found for branch '{branch}'")
         raise typer.Exit(1)
 
+    _, worktree = found
+
     # Show worktree details
     console.print(f"Branch: [cyan]{worktree.branch}[/cyan]")
     console.print(f"Path: {worktree.path}")
@@ -80,7 +62,8 @@ def remove(
             raise typer.Exit(0)
 
     # Set up progress callback
-    manager.progress_callback = OperationProgressReporter()
+    reporter = OperationProgressReporter()
+    manager.progress_callback = reporter
 
     # Build options
     options = RemoveOptions(
@@ -92,7 +75,10 @@ def remove(
 
     # Execute
     console.print()
-    result = manager.remove(options)
+    try:
+        result = manager.remove(options)
+    finally:
+        reporter.flush()
 
     if result.success:
         print_success(f"Worktree removed: {worktree.branch}")
@@ -0,0 +1,27 @@
+"""Shared helpers for CLI commands."""
+
+import typer
+
+from workgarden.config.loader import ConfigLoader
+from workgarden.config.schema import WorkgardenConfig
+from workgarden.exceptions import ConfigNotFoundError, RootDetectionError
+
+
+def require_config() -> WorkgardenConfig:
+    """Load the main repository's config or exit with an error.
+
+    Raises:
+        typer.Exit: If not in a git repository or no config file exists
+    """
+    try:
+        return ConfigLoader().load()
+    except RootDetectionError:
+        from workgarden.utils.console import print_error
+
+        print_error("Not in a git repository")
+        raise typer.Exit(1)
+    except ConfigNotFoundError:
+        from workgarden.utils.console import print_error
+
+        print_error("No .workgarden.yaml found in main repository. Run 'wg config init' first.")
+        raise typer.Exit(1)
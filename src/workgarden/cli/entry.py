@@ -0,0 +1,93 @@
+"""Console entry point with fast paths that run before Typer is imported.
+
+Fast paths (keep this list in sync with run()):
+
+- `wg`, `wg --help`, `wg --version`, `wg open --list-editors` are answered
+  from static data, never importing Typer, config loading, or worktrees.
+- `wg list --json`, the usual scripting call, invokes the command function
+  directly and skips click's argument parsing.
+
+Everything else is handed to the Typer app.
+"""
+
+import sys
+from pathlib import Path
+
+from workgarden import __version__
+
+APP_HELP = "Git worktree manager with Docker Compose support."
+
+# Subcommand registry: name -> (module, attribute, short help).
+# The Typer app imports each module only when its command is dispatched.
+COMMANDS: dict[str, tuple[str, str, str]] = {
+    "config": ("workgarden.cli.commands.config", "app", "Configuration management."),
+    "create": ("workgarden.cli.commands.create", "create", "Create a new worktree."),
+    "remove": ("workgarden.cli.commands.remove", "remove", "Remove a worktree."),
+    "list": ("workgarden.cli.commands.list", "list_worktrees", "List all managed worktrees."),
+    "open": ("workgarden.cli.commands.open", "open_worktree", "Open a worktree in an editor."),
+}
+
+
+def get_version_string() -> str:
+    """Version line printed by --version."""
+    return f"workgarden {__version__}"
+
+
+def get_help_text(prog: str) -> str:
+    """Static top-level help text."""
+    width = max(len(name) for name in COMMANDS)
+    commands = "\n".join(
+        f"  {name:<{width}}  {short_help}" for name, (_, _, short_help) in COMMANDS.items()
+    )
+    return (
+        f"Usage: {prog} [OPTIONS] COMMAND [ARGS]...\n"
+        f"\n"
+        f"  {APP_HELP}\n"
+        f"\n"
+        f"Options:\n"
+        f"  -V, --version  Show version and exit.\n"
+        f"  --help         Show this message and exit.\n"
+        f"\n"
+        f"Commands:\n"
+        f"{commands}\n"
+    )
+
+
+def _prog_name() -> str:
+    name = Path(sys.argv[0]).name
+    return "python -m workgarden" if name == "__main__.py" else name
+
+
+def run(argv: list[str] | None = None) -> None:
+    """Run the CLI, short-circuiting static invocations."""
+    args = sys.argv[1:] if argv is None else argv
+
+    if args in ([], ["--help"]):
+        sys.stdout.write(get_help_text(_prog_name()))
+        return
+
+    if args in (["--version"], ["-V"]):
+        sys.stdout.write(get_version_string() + "\n")
+        return
+
+    if args == ["open", "--list-editors"]:
+        from workgarden.utils.console import print_available_editors
+        from workgarden.utils.editor import detect_available_editors
+
+        print_available_editors(detect_available_editors())
+        return
+
+    if args == ["list", "--json"]:
+        import typer
+
+        from workgarden.cli.commands.list import list_worktrees
+
+        try:
+            list_worktrees(json_output=True)
+        except typer.Exit as e:
+            sys.exit(e.exit_code)
+        return
+
+    from workgarden.cli.app import app
+
+    app(args=args)
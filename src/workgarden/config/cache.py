@@ -0,0 +1,93 @@
+"""On-disk cache of parsed and validated configuration.
+
+Entries are keyed by the config file's path, mtime and size, so any edit to
+.workgarden.yaml produces a new key and the stale entry ages out of the cache.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from workgarden import __version__
+from workgarden.config.schema import WorkgardenConfig
+
+CACHE_MAX_ENTRIES = 20
+NO_CACHE_ENV = "WG_NO_CACHE"
+
+# Written before every pickle. Bump the format tag when WorkgardenConfig changes
+# shape; the package version is included so upgrades never read stale entries.
+CACHE_HEADER = f"WG3:{__version__}\n".encode()
+
+
+def get_cache_dir() -> Path:
+    """Directory holding cached configs ($XDG_CACHE_HOME/workgarden)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "workgarden"
+
+
+def cache_enabled() -> bool:
+    """Check if the config cache is enabled (disabled by WG_NO_CACHE=1)."""
+    return os.environ.get(NO_CACHE_ENV) != "1"
+
+
+def get_cache_path(config_path: Path, stat: os.stat_result) -> Path:
+    """Get the cache entry path for a config file fingerprint."""
+    fingerprint = f"{config_path}\0{stat.st_mtime_ns}\0{stat.st_size}"
+    key = hashlib.blake2b(fingerprint.encode()).hexdigest()[:16]
+    return get_cache_dir() / f"config-{key}.pkl"
+
+
+def read_cached_config(cache_path: Path) -> WorkgardenConfig | None:
+    """Read a cached config, or None on miss.
+
+    Entries hold already-validated WorkgardenConfig instances, so a hit skips
+    YAML parsing and model validation entirely.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            if f.read(len(CACHE_HEADER)) != CACHE_HEADER:
+                return None
+            config = pickle.load(f)
+        # Refresh access time so eviction keeps recently used entries
+        os.utime(cache_path)
+    except Exception:
+        # A missing, corrupt or unreadable entry is just a cache miss
+        return None
+
+    if not isinstance(config, WorkgardenConfig):
+        return None
+    return config
+
+
+def write_cached_config(cache_path: Path, config: WorkgardenConfig) -> None:
+    """Write a config to the cache atomically, evicting old entries."""
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(CACHE_HEADER)
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        _evict(cache_path.parent)
+    except OSError:
+        # Caching is best-effort - never fail a load because of it
+        tmp_path.unlink(missing_ok=True)
+
+
+def _evict(cache_dir: Path) -> None:
+    """Drop least recently used entries beyond CACHE_MAX_ENTRIES."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.startswith("config-") and entry.name.endswith(".pkl"):
+            entries.append((entry.stat().st_atime_ns, entry.path))
+
+    if len(entries) <= CACHE_MAX_ENTRIES:
+        return
+
+    entries.sort()
+    for _, path in entries[: len(entries) - CACHE_MAX_ENTRIES]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
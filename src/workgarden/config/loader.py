@@ -1,20 +1,33 @@
 """Configuration loader for .workgarden.yaml."""
 
+import os
 from pathlib import Path
 
-import yaml
-from pydantic import ValidationError
-
+from workgarden.config.cache import (
+    cache_enabled,
+    get_cache_path,
+    read_cached_config,
+    write_cached_config,
+)
 from workgarden.config.schema import WorkgardenConfig
 from workgarden.exceptions import ConfigNotFoundError, ConfigValidationError
 from workgarden.utils.root import find_main_repo_root
 
 CONFIG_FILENAME = ".workgarden.yaml"
 
+# Configs already loaded by this process, keyed like the on-disk cache by the
+# file's path, mtime and size. A CLI command typically builds more than one
+# ConfigLoader (require_config() and WorktreeManager); only the first one reads
+# the cache entry or parses the file.
+_loaded_configs: dict[tuple[Path, int, int], WorkgardenConfig] = {}
+LOADED_CONFIGS_MAX = 8
+
 
 class ConfigLoader:
     """Loads and manages workgarden configuration."""
 
+    __slots__ = ("root_path", "_config")
+
     def __init__(self, root_path: Path | None = None):
         self.root_path = root_path or find_main_repo_root()
         self._config: WorkgardenConfig | None = None
@@ -33,19 +46,62 @@ class ConfigLoader:
 
     def exists(self) -> bool:
         """Check if config file exists."""
+        if self._config is not None:
+            return True
         return self.config_path.exists()
 
     def load(self) -> WorkgardenConfig:
-        """Load configuration from file."""
-        if not self.exists():
+        """Load configuration from file.
+
+        Validated configs are cached on disk keyed by the file's mtime and size,
+        so repeated invocations skip YAML parsing and validation; within one
+        process, repeated loads of an unchanged file return the same instance.
+        """
+        try:
+            stat = os.stat(self.config_path)
+        except FileNotFoundError:
             raise ConfigNotFoundError(f"Config file not found: {self.config_path}")
 
+        if not cache_enabled():
+            return self._parse()
+
+        key = (self.config_path, stat.st_mtime_ns, stat.st_size)
+        config = _loaded_configs.get(key)
+        if config is not None:
+            return config
+
+        cache_path = get_cache_path(self.config_path, stat)
+        config = read_cached_config(cache_path)
+        if config is None:
+            config = self._parse()
+            write_cached_config(cache_path, config)
+
+        if len(_loaded_configs) >= LOADED_CONFIGS_MAX:
+            _loaded_configs.clear()
+        _loaded_configs[key] = config
+        return config
+
+    def _parse(self) -> WorkgardenConfig:
+        """Parse and validate the config file."""
+        # YAML and validation imports are deferred to cache misses, keeping
+        # the common (cached) read path free of them.
+        import yaml
+        from pydantic import ValidationError
+
+        try:
+            from yaml import CSafeLoader as _SafeLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as _SafeLoader
+
         try:
             with open(self.config_path) as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ConfigValidationError(f"Invalid YAML in config file: {e}") from e
 
+        if not data:
+            return WorkgardenConfig()
+
         try:
             return WorkgardenConfig.model_validate(data)
         except ValidationError as e:
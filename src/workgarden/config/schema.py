@@ -1,11 +1,25 @@
-"""Pydantic models for .workgarden.yaml configuration."""
+"""Pydantic models for .workgarden.yaml configuration.
 
-from pydantic import BaseModel, Field
+Models are frozen: configs are loaded once and shared (DEFAULT_CONFIG, the
+on-disk cache), so nothing should modify them after validation.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+_DEFAULT_COPY_FILES = (".env",)
+_DEFAULT_COMPOSE_FILES = ("docker-compose.yml",)
+_DEFAULT_ENV_ALLOWLIST = ("*",)
+
+HookEvent = Literal["post_create", "post_setup", "pre_remove", "post_remove"]
 
 
 class SubstitutionsConfig(BaseModel):
     """Environment variable substitution settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = True
     custom_variables: dict[str, str] = Field(default_factory=dict)
 
@@ -13,13 +27,17 @@ class SubstitutionsConfig(BaseModel):
 class EnvironmentConfig(BaseModel):
     """Environment file handling configuration."""
 
-    copy_files: list[str] = Field(default_factory=lambda: [".env"])
+    model_config = ConfigDict(frozen=True)
+
+    copy_files: list[str] = Field(default_factory=lambda: list(_DEFAULT_COPY_FILES))
     substitutions: SubstitutionsConfig = Field(default_factory=SubstitutionsConfig)
 
 
 class PortsConfig(BaseModel):
     """Port allocation configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     base_port: int = 10000
     max_port: int = 65000
     named_mappings: dict[str, str] = Field(default_factory=dict)
@@ -28,22 +46,32 @@ class PortsConfig(BaseModel):
 class DockerComposeConfig(BaseModel):
     """Docker Compose configuration."""
 
-    files: list[str] = Field(default_factory=lambda: ["docker-compose.yml"])
+    model_config = ConfigDict(frozen=True)
+
+    files: list[str] = Field(default_factory=lambda: list(_DEFAULT_COMPOSE_FILES))
     ports: PortsConfig = Field(default_factory=PortsConfig)
 
 
 class HooksConfig(BaseModel):
     """Lifecycle hooks configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     post_create: list[str] = Field(default_factory=list)
     post_setup: list[str] = Field(default_factory=list)
     pre_remove: list[str] = Field(default_factory=list)
     post_remove: list[str] = Field(default_factory=list)
+    # Lifecycle events whose hooks are independent and may run concurrently
+    parallel: list[HookEvent] = Field(default_factory=list)
+    # Environment variables passed to hooks (fnmatch patterns, "*" = all)
+    env_allowlist: list[str] = Field(default_factory=lambda: list(_DEFAULT_ENV_ALLOWLIST))
 
 
 class EditorConfig(BaseModel):
     """Editor configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     command: str | None = None  # e.g., "code", "cursor"
     auto_open: bool = False  # Open automatically on create
 
@@ -51,6 +79,8 @@ class EditorConfig(BaseModel):
 class WorkgardenConfig(BaseModel):
     """Root configuration model for .workgarden.yaml."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = "1.0"
     worktree_base_path: str = "../{repo_name}-worktrees"
     worktree_naming: str = "{branch_slug}"
@@ -60,8 +90,15 @@ class WorkgardenConfig(BaseModel):
     editor: EditorConfig = Field(default_factory=EditorConfig)
 
     def to_yaml_dict(self) -> dict:
-        """Convert to dictionary suitable for YAML output."""
+        """Convert to dictionary suitable for YAML output.
+
+        The dump of DEFAULT_CONFIG is computed once at import; its nested values
+        are shared, so callers must not mutate the result.
+        """
+        if self is DEFAULT_CONFIG:
+            return dict(_DEFAULT_CONFIG_YAML_DICT)
         return self.model_dump(mode="json")
 
 
 DEFAULT_CONFIG = WorkgardenConfig()
+_DEFAULT_CONFIG_YAML_DICT = DEFAULT_CONFIG.model_dump(mode="json")
@@ -1,10 +1,18 @@
 """Lifecycle hook execution for worktree operations."""
 
+import errno
 import logging
 import os
+import shutil
+import signal
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from workgarden.exceptions import HookError
 from workgarden.utils.template import TemplateContext, substitute_variables
@@ -13,6 +21,82 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 300  # 5 minutes
 
+# Characters that make a command depend on shell parsing (quoting, expansion,
+# redirection, chaining, comments, multiple lines)
+SHELL_METACHARACTERS = frozenset("|&;<>()$`\\\"'*?[]{}~#\n")
+
+# Words that must be run by the shell even if a same-named program is on PATH:
+# POSIX special builtins and reserved words, the builtins that act on the shell
+# itself, and common non-POSIX builtins
+SHELL_BUILTINS = frozenset(
+    # Special builtins
+    ". : break continue eval exec exit export readonly return set shift times trap unset "
+    # Reserved words
+    "! { } case do done elif else esac fi for function if in select then until while "
+    # Builtins that read or change shell state
+    "alias bg cd command fc fg getopts hash jobs read type ulimit umask unalias wait "
+    # Common bash/zsh builtins
+    "builtin declare let local source time typeset".split()
+)
+
+
+@lru_cache(maxsize=256)
+def _simple_argv(command: str) -> tuple[str, ...] | None:
+    """Split a command into argv if its syntax needs no shell.
+
+    Only commands made of plain whitespace-separated words qualify, and for
+    those plain splitting is exactly what the shell would do. Returns None for
+    anything that needs the shell. HookRunner additionally requires argv[0]
+    to be a program it can find.
+    """
+    if not SHELL_METACHARACTERS.isdisjoint(command):
+        return None
+    argv = tuple(command.split())
+    # Leading VAR=value assignments are shell syntax too
+    if not argv or argv[0] in SHELL_BUILTINS or "=" in argv[0]:
+        return None
+    return argv
+
+
+def _spawn_hook(
+    spawn: Callable[..., Any], command: str, argv: tuple[str, ...] | None, **kwargs: Any
+) -> Any:
+    """Start a hook with spawn (subprocess.run or Popen), exec'ing argv directly if given.
+
+    An executable script without a shebang line can't be exec'd (ENOEXEC);
+    sh runs such scripts itself, so those fall back to the shell.
+    """
+    if argv is not None:
+        try:
+            return spawn(argv, shell=False, **kwargs)
+        except OSError as e:
+            if e.errno != errno.ENOEXEC:
+                raise
+    return spawn(command, shell=True, **kwargs)
+
+
+def _filter_environment(allowlist: list[str]) -> dict[str, str]:
+    """Copy the variables from os.environ whose names match the allowlist.
+
+    Plain names are looked up directly; only entries containing wildcards are
+    matched against every variable.
+    """
+    env = {name: os.environ[name] for name in allowlist if name in os.environ}
+    patterns = [pattern for pattern in allowlist if any(c in pattern for c in "*?[")]
+    if patterns:
+        for name, value in os.environ.items():
+            if any(fnmatchcase(name, pattern) for pattern in patterns):
+                env[name] = value
+    return env
+
+
+def _signal_group(process: subprocess.Popen, sig: signal.Signals) -> None:
+    """Send a signal to a hook's whole process group."""
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        pass
+
 
 @dataclass
 class HookResult:
@@ -36,13 +120,18 @@ class HookRunnerResult:
 
 
 class HookRunner:
-    """Execute shell commands at worktree lifecycle points."""
+    """Execute shell commands at worktree lifecycle points.
+
+    Commands without shell syntax run directly, without an intermediate shell;
+    everything else runs through /bin/sh.
+    """
 
     def __init__(
         self,
         context: TemplateContext,
         working_dir: Path | None = None,
-        timeout: int = DEFAULT_TIMEOUT,
+        timeout: float = DEFAULT_TIMEOUT,
+        env_allowlist: list[str] | None = None,
     ):
         """Initialize hook runner.
 
@@ -50,21 +139,52 @@ class HookRunner:
             context: Template context for variable substitution
             working_dir: Directory to run commands in (defaults to context.worktree_path)
             timeout: Timeout in seconds for each command (default 5 minutes)
+            env_allowlist: Names/fnmatch patterns of environment variables passed to
+                hooks (default: the whole environment)
         """
         self.context = context
         self.working_dir = working_dir or context.worktree_path
         self.timeout = timeout
+        self.env_allowlist = env_allowlist
+        self._env: dict[str, str] | None = None
+
+    @property
+    def env(self) -> dict[str, str]:
+        """Environment for hook processes, built once per runner."""
+        if self._env is None:
+            self._env = self._build_environment()
+        return self._env
 
     def _build_environment(self) -> dict[str, str]:
         """Build environment with WG_* variables."""
-        env = os.environ.copy()
+        if self.env_allowlist is None or "*" in self.env_allowlist:
+            env = os.environ.copy()
+        else:
+            env = _filter_environment(self.env_allowlist)
 
         # Add WG_* prefixed variables
-        for name, value in self.context.get_variables().items():
+        for name, value in self.context.substitutions.items():
             env[f"WG_{name}"] = value
 
         return env
 
+    def _argv(self, command: str) -> tuple[str, ...] | None:
+        """Get the argv to exec a hook directly, or None to run it with the shell.
+
+        Commands only skip the shell when their program resolves on the hooks'
+        PATH; anything else (e.g. a builtin with no program behind it) keeps
+        the shell's behaviour.
+        """
+        argv = _simple_argv(command)
+        if argv is None:
+            return None
+        program = argv[0]
+        if os.sep in program and self.working_dir is not None:
+            program = os.path.join(self.working_dir, program)
+        if shutil.which(program, path=self.env.get("PATH", os.defpath)) is None:
+            return None
+        return argv
+
     def _execute_hook(self, command: str) -> HookResult:
         """Execute a single hook command.
 
@@ -79,12 +199,16 @@ class HookRunner:
 
         logger.debug(f"Executing hook: {substituted_command}")
 
+        # Plain commands are exec'd directly, saving a /bin/sh process per hook
+        argv = self._argv(substituted_command)
+
         try:
-            result = subprocess.run(
+            result = _spawn_hook(
+                subprocess.run,
                 substituted_command,
-                shell=True,
+                argv,
                 cwd=self.working_dir,
-                env=self._build_environment(),
+                env=self.env,
                 capture_output=True,
                 text=True,
                 timeout=self.timeout,
@@ -125,7 +249,99 @@ class HookRunner:
                 error=str(e),
             )
 
-    def run(self, hook_name: str, hooks: list[str]) -> HookRunnerResult:
+    def _wait_for_hook(self, command: str, process: subprocess.Popen) -> HookResult:
+        """Wait for a launched hook process and collect its result."""
+        try:
+            stdout, stderr = process.communicate(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            _signal_group(process, signal.SIGKILL)
+            stdout, stderr = process.communicate()
+            logger.error(f"Hook command timed out after {self.timeout}s: {command}")
+            return HookResult(
+                command=command,
+                success=False,
+                error=f"Command timed out after {self.timeout} seconds",
+                stdout=stdout or "",
+                stderr=stderr or "",
+            )
+
+        success = process.returncode == 0
+        if not success:
+            logger.warning(f"Hook command failed with code {process.returncode}: {command}")
+        return HookResult(
+            command=command,
+            success=success,
+            stdout=stdout,
+            stderr=stderr,
+            return_code=process.returncode,
+        )
+
+    def _run_parallel(self, hooks: list[str]) -> list[HookResult]:
+        """Launch all hooks at once and collect results as they finish.
+
+        Fail-fast still applies: the first failure terminates hooks that are
+        still running.
+
+        Returns:
+            HookResults in the order of the hooks list
+        """
+        commands = [substitute_variables(command, self.context) for command in hooks]
+        env = self.env
+        processes: list[subprocess.Popen] = []
+
+        try:
+            for command in commands:
+                logger.debug(f"Launching hook: {command}")
+                argv = self._argv(command)
+                processes.append(
+                    _spawn_hook(
+                        subprocess.Popen,
+                        command,
+                        argv,
+                        cwd=self.working_dir,
+                        env=env,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        # Own process group so termination reaches the shell's children
+                        start_new_session=True,
+                    )
+                )
+        except OSError as e:
+            for process in processes:
+                _signal_group(process, signal.SIGKILL)
+                process.wait()
+            failed = commands[len(processes)]
+            logger.error(f"Hook command failed: {failed}: {e}")
+            return [HookResult(command=failed, success=False, error=str(e))]
+
+        results: list[HookResult | None] = [None] * len(processes)
+        with ThreadPoolExecutor(max_workers=len(processes)) as pool:
+            futures = {
+                pool.submit(self._wait_for_hook, command, process): index
+                for index, (command, process) in enumerate(zip(commands, processes))
+            }
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[futures[future]] = result
+                    if not result.success:
+                        for process in processes:
+                            if process.poll() is None:
+                                _signal_group(process, signal.SIGTERM)
+                        # Report the failure first so run() raises for it
+                        return [result]
+            except BaseException:
+                # Hooks run in their own sessions, so Ctrl-C never reaches them;
+                # kill them before the pool waits on their threads
+                for process in processes:
+                    if process.poll() is None:
+                        _signal_group(process, signal.SIGKILL)
+                raise
+
+        return results
+
+    def run(self, hook_name: str, hooks: list[str], parallel: bool = False) -> HookRunnerResult:
         """Execute all hooks for a lifecycle event.
 
         Uses fail-fast behavior: stops on first failure.
@@ -133,6 +349,7 @@ class HookRunner:
         Args:
             hook_name: Name of the lifecycle event (e.g., "post_create")
             hooks: List of shell commands to execute
+            parallel: Run the hooks concurrently (they must not depend on each other)
 
         Returns:
             HookRunnerResult with all execution results
@@ -146,18 +363,25 @@ class HookRunner:
 
         logger.info(f"Running {len(hooks)} {hook_name} hook(s)")
 
-        results: list[HookResult] = []
-
-        for command in hooks:
-            result = self._execute_hook(command)
-            results.append(result)
-
-            if not result.success:
-                # Fail-fast: stop on first failure
-                error_msg = result.error or result.stderr or f"Exit code {result.return_code}"
-                raise HookError(
-                    f"{hook_name} hook failed: {result.command}\n{error_msg}"
-                )
+        if parallel and len(hooks) > 1:
+            results = self._run_parallel(hooks)
+            for result in results:
+                if not result.success:
+                    self._raise_for_failure(hook_name, result)
+        else:
+            results = []
+            for command in hooks:
+                result = self._execute_hook(command)
+                results.append(result)
+
+                if not result.success:
+                    # Fail-fast: stop on first failure
+                    self._raise_for_failure(hook_name, result)
 
         logger.info(f"All {hook_name} hooks completed successfully")
         return HookRunnerResult(hook_name=hook_name, success=True, results=results)
+
+    def _raise_for_failure(self, hook_name: str, result: HookResult) -> None:
+        """Raise HookError describing a failed hook."""
+        error_msg = result.error or result.stderr or f"Exit code {result.return_code}"
+        raise HookError(f"{hook_name} hook failed: {result.command}\n{error_msg}")
@@ -3,9 +3,11 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import ClassVar
 
 from workgarden.config.loader import ConfigLoader
 from workgarden.config.schema import WorkgardenConfig
@@ -54,6 +56,13 @@ class RemoveOptions:
     skip_hooks: bool = False
 
 
+class SkipOperation(Exception):
+    """Raised by Operation.execute() to skip an operation without failing.
+
+    The transaction reports the operation as skipped and carries on.
+    """
+
+
 @dataclass
 class OperationResult:
     """Result of a worktree operation."""
@@ -66,7 +75,13 @@ class OperationResult:
 
 
 class Operation(ABC):
-    """Abstract base class for transactional operations."""
+    """Abstract base class for transactional operations.
+
+    Subclasses whose effects can't be undone set can_rollback = False; the
+    transaction then skips them when rolling back.
+    """
+
+    can_rollback: ClassVar[bool] = True
 
     def __init__(self, name: str):
         self.name = name
@@ -80,10 +95,6 @@ class Operation(ABC):
     def rollback(self) -> None:
         """Rollback the operation."""
 
-    def can_rollback(self) -> bool:
-        """Check if operation can be rolled back."""
-        return True
-
 
 class CreateWorktreeOperation(Operation):
     """Operation to create a git worktree."""
@@ -109,6 +120,47 @@ class CreateWorktreeOperation(Operation):
             self.git.worktree_remove(self.path, force=True)
 
 
+class RemoveWorktreeOperation(Operation):
+    """Operation to remove a git worktree."""
+
+    can_rollback = False
+
+    def __init__(self, git: GitUtils, path: Path, force: bool = False):
+        super().__init__(f"Remove worktree at {path}")
+        self.git = git
+        self.path = path
+        self.force = force
+
+    def execute(self) -> None:
+        self.git.worktree_remove(self.path, force=self.force)
+
+    def rollback(self) -> None:
+        # The worktree's working files are gone and can't be restored
+        pass
+
+
+class DeleteBranchOperation(Operation):
+    """Operation to delete a git branch, skipped if git refuses."""
+
+    can_rollback = False
+
+    def __init__(self, git: GitUtils, branch: str, force: bool = False):
+        super().__init__(f"Delete branch {branch}")
+        self.git = git
+        self.branch = branch
+        self.force = force
+
+    def execute(self) -> None:
+        try:
+            self.git.delete_branch(self.branch, force=self.force)
+        except GitError as e:
+            # Branch might not exist or be checked out elsewhere
+            raise SkipOperation(str(e)) from e
+
+    def rollback(self) -> None:
+        pass
+
+
 class UpdateStateOperation(Operation):
     """Operation to add worktree to state."""
 
@@ -125,8 +177,31 @@ class UpdateStateOperation(Operation):
         self.state_manager.remove_worktree(self.slug)
 
 
+class RemoveFromStateOperation(Operation):
+    """Operation to remove a worktree from state."""
+
+    def __init__(self, state_manager: StateManager, slug: str):
+        super().__init__(f"Update state for {slug}")
+        self.state_manager = state_manager
+        self.slug = slug
+        self._removed: WorktreeInfo | None = None
+
+    def execute(self) -> None:
+        self._removed = self.state_manager.remove_worktree(self.slug)
+
+    def rollback(self) -> None:
+        if self._removed is not None:
+            self.state_manager.add_worktree(self.slug, self._removed)
+
+
 class RunHookOperation(Operation):
-    """Operation to run lifecycle hooks."""
+    """Operation to run lifecycle hooks.
+
+    With warn_on_failure, a failing hook is logged and the operation skipped
+    instead of failing the transaction.
+    """
+
+    can_rollback = False
 
     def __init__(
         self,
@@ -134,41 +209,60 @@ class RunHookOperation(Operation):
         hooks: list[str],
         context: TemplateContext,
         working_dir: Path | None = None,
+        parallel: bool = False,
+        warn_on_failure: bool = False,
+        env_allowlist: list[str] | None = None,
     ):
         super().__init__(f"Run {hook_name} hooks")
         self.hook_name = hook_name
         self.hooks = hooks
         self.context = context
         self.working_dir = working_dir
+        self.parallel = parallel
+        self.warn_on_failure = warn_on_failure
+        self.env_allowlist = env_allowlist
 
     def execute(self) -> None:
-        if not self.hooks:
-            return
-
+        # Callers only build this operation for non-empty hook lists; an empty
+        # list still works (HookRunner.run returns immediately)
         runner = HookRunner(
             context=self.context,
             working_dir=self.working_dir,
+            env_allowlist=self.env_allowlist,
         )
-        runner.run(self.hook_name, self.hooks)
+        try:
+            runner.run(self.hook_name, self.hooks, parallel=self.parallel)
+        except HookError as e:
+            if not self.warn_on_failure:
+                raise
+            logging.getLogger(__name__).warning(f"{self.hook_name} hook failed: {e}")
+            raise SkipOperation(str(e)) from e
 
     def rollback(self) -> None:
         # Hooks cannot be rolled back - side effects can't be undone
         pass
 
-    def can_rollback(self) -> bool:
-        return False
-
 
 ProgressCallback = Callable[[str, str], None]
 
 
 class TransactionManager:
-    """Manages a sequence of operations with rollback support."""
+    """Manages a sequence of operations with rollback support.
+
+    When given a StateManager, state changes made by the operations are
+    flushed to disk once, after the transaction succeeds or is rolled back.
+    """
 
-    def __init__(self, dry_run: bool = False, progress_callback: ProgressCallback | None = None):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        state_manager: StateManager | None = None,
+    ):
         self.operations: list[Operation] = []
         self.dry_run = dry_run
         self.progress_callback = progress_callback
+        self.state_manager = state_manager
         self._completed: list[Operation] = []
 
     def add(self, operation: Operation) -> None:
@@ -203,6 +297,9 @@ class TransactionManager:
                 op.status = OperationStatus.COMPLETED
                 self._completed.append(op)
                 self._report(op.name, "completed")
+            except SkipOperation:
+                op.status = OperationStatus.SKIPPED
+                self._report(op.name, "skipped")
             except Exception as e:
                 op.status = OperationStatus.FAILED
                 self._report(op.name, "failed")
@@ -212,8 +309,19 @@ class TransactionManager:
                 rollback_errors = self._rollback()
                 return False, error_msg, rollback_errors
 
+        try:
+            self._flush_state()
+        except OSError as e:
+            # State couldn't be persisted - undo the operations it describes
+            return False, f"Failed to save state: {e}", self._rollback()
+
         return True, None, []
 
+    def _flush_state(self) -> None:
+        """Persist pending state changes, if a state manager is attached."""
+        if self.state_manager is not None:
+            self.state_manager.flush()
+
     def _rollback(self) -> list[str]:
         """Rollback completed operations in reverse order.
 
@@ -223,7 +331,7 @@ class TransactionManager:
         errors: list[str] = []
 
         for op in reversed(self._completed):
-            if not op.can_rollback():
+            if not op.can_rollback:
                 continue
 
             self._report(op.name, "rolling_back")
@@ -233,6 +341,11 @@ class TransactionManager:
             except Exception as e:
                 errors.append(f"{op.name}: {e}")
 
+        try:
+            self._flush_state()
+        except OSError as e:
+            errors.append(f"Save state: {e}")
+
         return errors
 
 
@@ -257,6 +370,11 @@ class WorktreeManager:
             self._git = GitUtils(self.root_path)
         return self._git
 
+    @property
+    def repo_name(self) -> str:
+        """Repository name (GitUtils looks it up once)."""
+        return self.git.get_repo_name()
+
     @property
     def state(self) -> StateManager:
         """Lazy-load StateManager."""
@@ -276,15 +394,17 @@ class WorktreeManager:
         """Get loaded config."""
         return self.config_loader.config
 
-    def _calculate_worktree_path(self, branch: str) -> Path:
-        """Calculate the worktree path from config templates."""
-        slug = get_branch_slug(branch)
-        repo_name = self.git.get_repo_name()
+    def _calculate_worktree_path(self, branch: str, slug: str | None = None) -> Path:
+        """Calculate the worktree path from config templates.
 
+        Args:
+            branch: Branch name
+            slug: Precomputed slug for the branch, if the caller already has it
+        """
         context = TemplateContext(
             branch=branch,
-            branch_slug=slug,
-            repo_name=repo_name,
+            branch_slug=slug or get_branch_slug(branch),
+            repo_name=self.repo_name,
         )
 
         # Resolve base path
@@ -296,9 +416,11 @@ class WorktreeManager:
         full_path = (self.root_path / base_path / worktree_name).resolve()
         return full_path
 
-    def _find_worktree_by_branch(self, branch: str) -> tuple[str, WorktreeInfo] | None:
+    def find_by_branch(self, branch: str) -> tuple[str, WorktreeInfo] | None:
         """Find worktree by branch name or slug.
 
+        Only consults the in-memory state; no git calls or status checks.
+
         Returns:
             Tuple of (slug, WorktreeInfo) or None if not found
         """
@@ -308,11 +430,10 @@ class WorktreeManager:
             return slug, worktree
 
         # Try to find by exact branch match
-        for s, wt in self.state.list_worktrees().items():
-            if wt.branch == branch:
-                return s, wt
-
-        return None
+        slug = self.state.find_slug_by_branch(branch)
+        if slug is None:
+            return None
+        return slug, self.state.get_worktree(slug)
 
     def create(self, options: CreateOptions) -> OperationResult:
         """Create a new worktree.
@@ -338,7 +459,7 @@ class WorktreeManager:
         create_branch = not branch_exists
 
         # Calculate worktree path
-        worktree_path = self._calculate_worktree_path(options.branch)
+        worktree_path = self._calculate_worktree_path(options.branch, slug)
 
         # Check if path already exists
         if worktree_path.exists() and not options.dry_run:
@@ -359,13 +480,17 @@ class WorktreeManager:
             branch=options.branch,
             branch_slug=slug,
             worktree_path=worktree_path,
-            repo_name=self.git.get_repo_name(),
+            repo_name=self.repo_name,
         )
 
+        # Resolve the hooks config once for all operations below
+        hooks_config = self.config.hooks
+
         # Build transaction
         transaction = TransactionManager(
             dry_run=options.dry_run,
             progress_callback=self.progress_callback,
+            state_manager=self.state,
         )
 
         # Step 1: Create git worktree
@@ -379,13 +504,15 @@ class WorktreeManager:
         )
 
         # Step 2: Run post_create hooks
-        if not options.skip_hooks:
+        if not options.skip_hooks and hooks_config.post_create:
             transaction.add(
                 RunHookOperation(
                     hook_name="post_create",
-                    hooks=self.config.hooks.post_create,
+                    hooks=hooks_config.post_create,
                     context=context,
                     working_dir=worktree_path,
+                    parallel="post_create" in hooks_config.parallel,
+                    env_allowlist=hooks_config.env_allowlist,
                 )
             )
 
@@ -399,13 +526,15 @@ class WorktreeManager:
         )
 
         # Step 4: Run post_setup hooks
-        if not options.skip_hooks:
+        if not options.skip_hooks and hooks_config.post_setup:
             transaction.add(
                 RunHookOperation(
                     hook_name="post_setup",
-                    hooks=self.config.hooks.post_setup,
+                    hooks=hooks_config.post_setup,
                     context=context,
                     working_dir=worktree_path,
+                    parallel="post_setup" in hooks_config.parallel,
+                    env_allowlist=hooks_config.env_allowlist,
                 )
             )
 
@@ -435,7 +564,7 @@ class WorktreeManager:
             OperationResult with success status
         """
         # Find worktree
-        result = self._find_worktree_by_branch(options.branch)
+        result = self.find_by_branch(options.branch)
         if not result:
             return OperationResult(
                 success=False,
@@ -443,9 +572,11 @@ class WorktreeManager:
             )
 
         slug, worktree = result
+        # Stat once - reused for the uncommitted check and the removal step
+        path_exists = worktree.path.exists()
 
         # Check for uncommitted changes (unless force)
-        if worktree.path.exists() and not options.force:
+        if path_exists and not options.force:
             try:
                 if self.git.has_uncommitted_changes(worktree.path):
                     return OperationResult(
@@ -461,82 +592,76 @@ class WorktreeManager:
             branch=worktree.branch,
             branch_slug=slug,
             worktree_path=worktree.path,
-            repo_name=self.git.get_repo_name(),
+            repo_name=self.repo_name,
             port_mappings=worktree.port_mappings,
         )
 
-        # Run pre_remove hooks (run in worktree directory, fail if hooks fail)
-        if not options.skip_hooks and self.config.hooks.pre_remove:
-            if self.progress_callback:
-                self.progress_callback("Run pre_remove hooks", "starting")
-            try:
-                runner = HookRunner(context=context, working_dir=worktree.path)
-                runner.run("pre_remove", self.config.hooks.pre_remove)
-                if self.progress_callback:
-                    self.progress_callback("Run pre_remove hooks", "completed")
-            except HookError as e:
-                if self.progress_callback:
-                    self.progress_callback("Run pre_remove hooks", "failed")
-                return OperationResult(
-                    success=False,
-                    error=str(e),
-                )
+        # Resolve the hooks config once for all operations below
+        hooks_config = self.config.hooks
 
-        # Remove git worktree
-        if worktree.path.exists():
-            if self.progress_callback:
-                self.progress_callback(f"Remove worktree at {worktree.path}", "starting")
-            try:
-                self.git.worktree_remove(worktree.path, force=options.force)
-                if self.progress_callback:
-                    self.progress_callback(f"Remove worktree at {worktree.path}", "completed")
-            except GitError as e:
-                if self.progress_callback:
-                    self.progress_callback(f"Remove worktree at {worktree.path}", "failed")
-                return OperationResult(
-                    success=False,
-                    error=str(e),
+        # Build transaction
+        transaction = TransactionManager(
+            progress_callback=self.progress_callback,
+            state_manager=self.state,
+        )
+
+        # Step 1: Run pre_remove hooks (in worktree directory, fail if hooks fail)
+        if not options.skip_hooks and hooks_config.pre_remove:
+            transaction.add(
+                RunHookOperation(
+                    hook_name="pre_remove",
+                    hooks=hooks_config.pre_remove,
+                    context=context,
+                    working_dir=worktree.path,
+                    parallel="pre_remove" in hooks_config.parallel,
+                    env_allowlist=hooks_config.env_allowlist,
                 )
+            )
 
-        # Remove from state
-        if self.progress_callback:
-            self.progress_callback(f"Update state for {slug}", "starting")
-        self.state.remove_worktree(slug)
-        if self.progress_callback:
-            self.progress_callback(f"Update state for {slug}", "completed")
+        # Step 2: Remove git worktree
+        if path_exists:
+            transaction.add(
+                RemoveWorktreeOperation(git=self.git, path=worktree.path, force=options.force)
+            )
+
+        # Step 3: Remove from state
+        transaction.add(RemoveFromStateOperation(state_manager=self.state, slug=slug))
 
-        # Delete branch (unless --keep-branch)
+        # Step 4: Delete branch (unless --keep-branch)
         if not options.keep_branch:
-            if self.progress_callback:
-                self.progress_callback(f"Delete branch {worktree.branch}", "starting")
-            try:
-                self.git.delete_branch(worktree.branch, force=options.force)
-                if self.progress_callback:
-                    self.progress_callback(f"Delete branch {worktree.branch}", "completed")
-            except GitError:
-                # Branch might not exist or be checked out elsewhere
-                if self.progress_callback:
-                    self.progress_callback(f"Delete branch {worktree.branch}", "skipped")
-
-        # Run post_remove hooks (run in main repo directory, log warning but don't fail)
-        if not options.skip_hooks and self.config.hooks.post_remove:
-            if self.progress_callback:
-                self.progress_callback("Run post_remove hooks", "starting")
-            try:
-                runner = HookRunner(context=context, working_dir=self.root_path)
-                runner.run("post_remove", self.config.hooks.post_remove)
-                if self.progress_callback:
-                    self.progress_callback("Run post_remove hooks", "completed")
-            except HookError as e:
-                # Log warning but don't fail - worktree is already removed
-                logging.getLogger(__name__).warning(f"post_remove hook failed: {e}")
-                if self.progress_callback:
-                    self.progress_callback("Run post_remove hooks", "warning")
-
-        return OperationResult(
-            success=True,
-            worktree=worktree,
-        )
+            transaction.add(
+                DeleteBranchOperation(git=self.git, branch=worktree.branch, force=options.force)
+            )
+
+        # Step 5: Run post_remove hooks (in main repo directory, warn but don't fail -
+        # the worktree is already removed)
+        if not options.skip_hooks and hooks_config.post_remove:
+            transaction.add(
+                RunHookOperation(
+                    hook_name="post_remove",
+                    hooks=hooks_config.post_remove,
+                    context=context,
+                    working_dir=self.root_path,
+                    parallel="post_remove" in hooks_config.parallel,
+                    env_allowlist=hooks_config.env_allowlist,
+                    warn_on_failure=True,
+                )
+            )
+
+        # Execute transaction
+        success, error, rollback_errors = transaction.execute()
+
+        if success:
+            return OperationResult(
+                success=True,
+                worktree=worktree,
+            )
+        else:
+            return OperationResult(
+                success=False,
+                error=error,
+                rollback_errors=rollback_errors,
+            )
 
     def list(self) -> dict[str, WorktreeInfo]:
         """List all managed worktrees.
@@ -546,6 +671,16 @@ class WorktreeManager:
         """
         return self.state.list_worktrees()
 
+    def list_with_status(self) -> dict[str, tuple[WorktreeInfo, str]]:
+        """List all managed worktrees together with their statuses.
+
+        Returns:
+            Dictionary mapping slug to (WorktreeInfo, status string)
+        """
+        worktrees = self.list()
+        statuses = self.get_worktree_statuses(worktrees)
+        return {slug: (wt, statuses[slug]) for slug, wt in worktrees.items()}
+
     def get_worktree_status(self, worktree: WorktreeInfo) -> str:
         """Get status of a worktree.
 
@@ -562,3 +697,24 @@ class WorktreeManager:
             return "Missing"
 
         return "OK"
+
+    def get_worktree_statuses(self, worktrees: dict[str, WorktreeInfo]) -> dict[str, str]:
+        """Get statuses for several worktrees concurrently.
+
+        Each status check shells out to git, so checks run in a thread pool and
+        N worktrees cost roughly one git round-trip instead of N.
+
+        Returns:
+            Dictionary mapping slug to status string
+        """
+        if not worktrees:
+            return {}
+
+        # Initialize the lazy GitUtils before threads race for it
+        self.git
+
+        with ThreadPoolExecutor(max_workers=min(16, len(worktrees))) as pool:
+            futures = {
+                slug: pool.submit(self.get_worktree_status, wt) for slug, wt in worktrees.items()
+            }
+            return {slug: future.result() for slug, future in futures.items()}
@@ -1,30 +1,58 @@
 """State management for workgarden."""
 
 import json
+import mmap
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from pydantic import BaseModel, Field
-
 from workgarden.exceptions import StateError
 from workgarden.models.worktree import WorktreeInfo
 from workgarden.utils.root import find_main_repo_root
 
 STATE_FILENAME = ".workgarden.state.json"
 
+# State files at least this large are parsed straight from a read-only mmap
+# instead of being read into a buffer first
+MMAP_THRESHOLD = 64 * 1024
+
+
+def _loads_state(path: Path) -> dict:
+    """Parse the state file, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _dumps_state(data: dict) -> bytes:
+    """Serialize state to compact JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, separators=(",", ":")).encode()
+    return orjson.dumps(data)
+
 
-class WorkgardenState(BaseModel):
+@dataclass(slots=True)
+class WorkgardenState:
     """State of all managed worktrees."""
 
-    worktrees: dict[str, WorktreeInfo] = Field(default_factory=dict)
-    allocated_ports: list[int] = Field(default_factory=list)
+    worktrees: dict[str, WorktreeInfo] = field(default_factory=dict)
+    allocated_ports: set[int] = field(default_factory=set)
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
         return {
-            "worktrees": {
-                slug: wt.model_dump_json_compatible() for slug, wt in self.worktrees.items()
-            },
-            "allocated_ports": self.allocated_ports,
+            "worktrees": {slug: wt.to_dict() for slug, wt in self.worktrees.items()},
+            "allocated_ports": sorted(self.allocated_ports),
         }
 
     @classmethod
@@ -35,16 +63,23 @@ class WorkgardenState(BaseModel):
             worktrees[slug] = WorktreeInfo.from_dict(wt_data)
         return cls(
             worktrees=worktrees,
-            allocated_ports=data.get("allocated_ports", []),
+            allocated_ports=set(data.get("allocated_ports", [])),
         )
 
 
 class StateManager:
-    """Manages the .workgarden.state.json file."""
+    """Manages the .workgarden.state.json file.
+
+    Mutations only mark the state dirty; call flush() (or save()) to persist
+    them. TransactionManager flushes once when a transaction finishes, so a
+    multi-step operation writes the file a single time.
+    """
 
     def __init__(self, root_path: Path | None = None):
         self.root_path = root_path or find_main_repo_root()
         self._state: WorkgardenState | None = None
+        self._dirty = False
+        self._branch_index: dict[str, str] | None = None
 
     @property
     def state_path(self) -> Path:
@@ -68,44 +103,66 @@ class StateManager:
             return WorkgardenState()
 
         try:
-            with open(self.state_path) as f:
-                data = json.load(f)
+            data = _loads_state(self.state_path)
             return WorkgardenState.from_dict(data)
         except json.JSONDecodeError as e:
             raise StateError(f"Invalid JSON in state file: {e}") from e
-        except (KeyError, ValueError) as e:
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
             raise StateError(f"Invalid state file format: {e}") from e
 
+    @property
+    def dirty(self) -> bool:
+        """Whether there are unsaved state changes."""
+        return self._dirty
+
     def save(self) -> None:
-        """Save current state to file."""
+        """Save current state to file atomically."""
         if self._state is None:
             return
 
-        with open(self.state_path, "w") as f:
-            json.dump(self._state.to_dict(), f, indent=2)
+        # Write next to the state file, then rename over it so readers never
+        # see a partially written file
+        tmp_path = self.state_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps_state(self._state.to_dict()))
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Save state to file if there are unsaved changes."""
+        if self._dirty:
+            self.save()
 
     def add_worktree(self, slug: str, worktree: WorktreeInfo) -> None:
-        """Add a worktree to state."""
+        """Add a worktree to state (persisted on the next flush)."""
         self.state.worktrees[slug] = worktree
-        for port in worktree.port_mappings.values():
-            if port not in self.state.allocated_ports:
-                self.state.allocated_ports.append(port)
-        self.save()
+        self._branch_index = None
+        self.state.allocated_ports.update(worktree.port_mappings.values())
+        self._dirty = True
 
     def remove_worktree(self, slug: str) -> WorktreeInfo | None:
-        """Remove a worktree from state and release its ports."""
+        """Remove a worktree from state and release its ports (persisted on the next flush)."""
         worktree = self.state.worktrees.pop(slug, None)
         if worktree:
-            for port in worktree.port_mappings.values():
-                if port in self.state.allocated_ports:
-                    self.state.allocated_ports.remove(port)
-            self.save()
+            self._branch_index = None
+            self.state.allocated_ports.difference_update(worktree.port_mappings.values())
+            self._dirty = True
         return worktree
 
     def get_worktree(self, slug: str) -> WorktreeInfo | None:
         """Get a worktree by slug."""
         return self.state.worktrees.get(slug)
 
+    def find_slug_by_branch(self, branch: str) -> str | None:
+        """Get the slug of the worktree checked out on an exact branch name."""
+        if self._branch_index is None:
+            self._branch_index = {wt.branch: slug for slug, wt in self.state.worktrees.items()}
+        return self._branch_index.get(branch)
+
     def list_worktrees(self) -> dict[str, WorktreeInfo]:
         """Get all worktrees."""
         return self.state.worktrees
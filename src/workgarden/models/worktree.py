@@ -1,25 +1,36 @@
 """Worktree information model."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from workgarden.utils.git import get_branch_slug
 
 
-class WorktreeInfo(BaseModel):
-    """Information about a managed worktree."""
+@dataclass(slots=True)
+class WorktreeInfo:
+    """Information about a managed worktree.
+
+    A plain dataclass rather than a pydantic model: instances are only built
+    from our own state file or by WorktreeManager, so per-field validation on
+    every load isn't worth its cost.
+    """
 
     path: Path
     branch: str
-    created_at: datetime = Field(default_factory=datetime.now)
-    port_mappings: dict[str, int] = Field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.now)
+    port_mappings: dict[str, int] = field(default_factory=dict)
+    _slug: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._slug = get_branch_slug(self.branch)
 
     @property
     def slug(self) -> str:
         """Get branch slug (used as worktree directory name)."""
-        return self.branch.replace("/", "-").replace("_", "-").lower()
+        return self._slug
 
-    def model_dump_json_compatible(self) -> dict:
+    def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
         return {
             "path": str(self.path),
@@ -1,12 +1,20 @@
 """Rich console helpers."""
 
-import yaml
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from rich.box import ROUNDED
 from rich.console import Console
 from rich.panel import Panel
 from rich.status import Status
-from rich.syntax import Syntax
 from rich.table import Table
+from rich.text import Text
+
+from workgarden.utils.editor import EditorInfo
+
+if TYPE_CHECKING:
+    from rich.syntax import SyntaxTheme
 
 console = Console()
 error_console = Console(stderr=True)
@@ -65,29 +73,119 @@ def create_table(
     return table
 
 
+def _freeze(value: object) -> tuple:
+    """Convert nested dicts/lists into a hashable, order-preserving form.
+
+    Every value is tagged with its type, so leaves that compare equal across
+    types (True, 1 and 1.0) don't share a cache key.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
+
+def _thaw(value: tuple) -> object:
+    """Rebuild the values frozen by _freeze()."""
+    kind, payload = value
+    if kind is dict:
+        return {_thaw(key): _thaw(item) for key, item in payload}
+    if kind is list:
+        return [_thaw(item) for item in payload]
+    return payload
+
+
+@lru_cache(maxsize=8)
+def _dump_config_yaml(frozen_config: tuple) -> str:
+    """Dump a frozen config dict to YAML, memoized so repeat displays skip the dump."""
+    # Only `wg config show` needs YAML - keep it out of every other command's imports
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as _SafeDumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper as _SafeDumper
+
+    return yaml.dump(
+        _thaw(frozen_config), Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+    )
+
+
+@lru_cache(maxsize=1)
+def _config_syntax_theme() -> SyntaxTheme:
+    """Load the monokai Pygments theme once instead of on every Syntax render."""
+    from rich.syntax import Syntax
+
+    return Syntax.get_theme("monokai")
+
+
 def print_config_panel(config_dict: dict, title: str = "Configuration") -> None:
     """Print configuration as a formatted panel."""
-    yaml_str = yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
-    syntax = Syntax(yaml_str, "yaml", theme="monokai", line_numbers=False)
+    # rich.syntax pulls in Pygments; like YAML, only `wg config show` needs it
+    from rich.syntax import Syntax
+
+    yaml_str = _dump_config_yaml(_freeze(config_dict))
+    syntax = Syntax(yaml_str, "yaml", theme=_config_syntax_theme(), line_numbers=False)
     console.print(Panel(syntax, title=title, border_style="blue"))
 
 
+# Status prefixes for print_operation_status, parsed from markup once
+STATUS_PREFIXES: dict[str, Text] = {
+    status: Text.from_markup(f"  {label} ")
+    for status, label in {
+        "starting": "[blue]...[/blue]",
+        "completed": "[green]OK[/green]",
+        "failed": "[red]FAILED[/red]",
+        "rolling_back": "[yellow]ROLLBACK[/yellow]",
+        "skipped": "[dim]SKIPPED[/dim]",
+    }.items()
+}
+
+
 def print_operation_status(name: str, status: str) -> None:
     """Print operation status with appropriate styling.
 
+    The name is printed literally, never parsed as markup.
+
     Args:
         name: Operation name/description
         status: One of "starting", "completed", "failed", "rolling_back", "skipped"
     """
-    status_styles = {
-        "starting": "[blue]...[/blue]",
-        "completed": "[green]OK[/green]",
-        "failed": "[red]FAILED[/red]",
-        "rolling_back": "[yellow]ROLLBACK[/yellow]",
-        "skipped": "[dim]SKIPPED[/dim]",
-    }
-    style = status_styles.get(status, status)
-    console.print(f"  {style} {name}")
+    prefix = STATUS_PREFIXES.get(status)
+    text = prefix.copy() if prefix is not None else Text.from_markup(f"  {status} ")
+    text.append(name)
+    console.print(text)
+
+
+def print_available_editors(editors: Sequence[EditorInfo]) -> None:
+    """Display available editors and configuration help.
+
+    Args:
+        editors: EditorInfo entries from detect_available_editors()
+    """
+    console.print("\n[bold]Available Editors:[/bold]\n")
+
+    available = [e for e in editors if e.available]
+    unavailable = [e for e in editors if not e.available]
+
+    if available:
+        for e in available:
+            console.print(f"  [green]✓[/green] {e.name} ([cyan]{e.command}[/cyan])")
+    else:
+        console.print("  [yellow]No known editors detected[/yellow]")
+
+    if unavailable:
+        console.print("\n[dim]Not installed:[/dim]")
+        for e in unavailable:
+            console.print(f"  [dim]✗ {e.name} ({e.command})[/dim]")
+
+    console.print("\n[bold]Configuration:[/bold]")
+    console.print("  Set default editor in .workgarden.yaml:")
+    console.print("  [dim]editor:[/dim]")
+    console.print("  [dim]  command: code  # or cursor, zed, etc.[/dim]")
+    console.print("  [dim]  auto_open: true  # open automatically on create[/dim]")
+    console.print("\n  Or set $VISUAL or $EDITOR environment variable.\n")
 
 
 def print_dry_run_banner() -> None:
@@ -100,15 +198,30 @@ def print_dry_run_banner() -> None:
     )
 
 
+# Labels for the final status of an operation
+FINAL_STATUS_LABELS = {
+    "completed": "[green]OK[/green]",
+    "failed": "[red]FAILED[/red]",
+    "rolling_back": "[yellow]ROLLBACK[/yellow]",
+    "skipped": "[dim]SKIPPED[/dim]",
+}
+
+
 class OperationProgressReporter:
     """Reports operation progress with live spinner updates.
 
     Shows a spinner while operation is running, then replaces with final status.
     Results in one line per operation instead of two (starting + completed).
+
+    Final status lines are buffered and written with a single print when the
+    next operation starts or flush() is called, so runs of lines without a
+    spinner in between (e.g. a rollback) cost one Rich render. Call flush()
+    once the operations are done.
     """
 
     def __init__(self) -> None:
         self._status: Status | None = None
+        self._pending: list[str] = []
 
     def __call__(self, name: str, status: str) -> None:
         """Handle operation status update.
@@ -118,23 +231,23 @@ class OperationProgressReporter:
             status: One of "starting", "completed", "failed", "rolling_back", "skipped"
         """
         if status == "starting":
-            self._stop_spinner()
+            self.flush()
             self._status = console.status(f"  [blue]...[/blue] {name}", spinner="dots")
             self._status.start()
-        elif status == "skipped":
-            self._stop_spinner()
-            console.print(f"  [dim]SKIPPED[/dim] {name}")
-        elif status == "completed":
-            self._stop_spinner()
-            console.print(f"  [green]OK[/green] {name}")
-        elif status == "failed":
-            self._stop_spinner()
-            console.print(f"  [red]FAILED[/red] {name}")
-        elif status == "rolling_back":
-            self._stop_spinner()
-            console.print(f"  [yellow]ROLLBACK[/yellow] {name}")
-        else:
+            return
+
+        label = FINAL_STATUS_LABELS.get(status)
+        if label is None:
             raise ValueError(f"Unknown operation status: {status!r}")
+        self._stop_spinner()
+        self._pending.append(f"  {label} {name}")
+
+    def flush(self) -> None:
+        """Stop any spinner and print buffered status lines."""
+        self._stop_spinner()
+        if self._pending:
+            console.print("\n".join(self._pending))
+            self._pending.clear()
 
     def _stop_spinner(self) -> None:
         """Stop the spinner if it's running."""
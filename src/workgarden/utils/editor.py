@@ -5,12 +5,13 @@ import shlex
 import shutil
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from workgarden.exceptions import EditorError
 
 
-@dataclass
+@dataclass(frozen=True)
 class EditorInfo:
     """Information about an editor."""
 
@@ -32,18 +33,49 @@ KNOWN_EDITORS: list[tuple[str, str]] = [
     ("PyCharm", "pycharm"),
 ]
 
+# Characters that need shlex to split an editor command correctly
+QUOTE_CHARACTERS = frozenset("\"'\\")
 
-def detect_available_editors() -> list[EditorInfo]:
+
+def _search_path() -> str:
+    """The PATH that executables are looked up in (os.defpath if unset)."""
+    return os.environ.get("PATH", os.defpath)
+
+
+@lru_cache(maxsize=64)
+def _which(command: str, search_path: str) -> str | None:
+    """shutil.which, memoized per PATH value so each search runs once."""
+    return shutil.which(command, path=search_path)
+
+
+def detect_available_editors() -> tuple[EditorInfo, ...]:
     """Detect which known editors are installed.
 
+    Each check searches the whole PATH, so results are cached per PATH value;
+    detection reruns only if PATH changes.
+
+    Returns:
+        EditorInfo for all known editors with availability status
+    """
+    return _detect_editors(_search_path())
+
+
+@lru_cache(maxsize=8)
+def _detect_editors(search_path: str) -> tuple[EditorInfo, ...]:
+    """Check every known editor against one PATH value."""
+    return tuple(
+        EditorInfo(name=name, command=command, available=_which(command, search_path) is not None)
+        for name, command in KNOWN_EDITORS
+    )
+
+
+def detect_available_editors_map() -> dict[str, EditorInfo]:
+    """Detect which known editors are installed, keyed by command.
+
     Returns:
-        List of EditorInfo for all known editors with availability status
+        Dictionary mapping editor command to its EditorInfo
     """
-    editors = []
-    for name, command in KNOWN_EDITORS:
-        available = shutil.which(command) is not None
-        editors.append(EditorInfo(name=name, command=command, available=available))
-    return editors
+    return {info.command: info for info in detect_available_editors()}
 
 
 def get_available_editors() -> list[EditorInfo]:
@@ -110,12 +142,16 @@ def open_editor(path: Path, editor_command: str | None = None) -> None:
             "$VISUAL, or $EDITOR environment variable."
         )
 
-    # Parse the command string to handle arguments (e.g., "code --wait")
-    command_args = shlex.split(command)
+    # Parse the command string to handle arguments (e.g., "code --wait");
+    # without quotes or escapes, shlex would just split on whitespace
+    if QUOTE_CHARACTERS.isdisjoint(command):
+        command_args = command.split()
+    else:
+        command_args = shlex.split(command)
     executable = command_args[0]
 
     # Verify the editor executable exists
-    if not shutil.which(executable):
+    if not _which(executable, _search_path()):
         raise EditorError(f"Editor executable '{executable}' not found in PATH")
 
     try:
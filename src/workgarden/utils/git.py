@@ -1,32 +1,73 @@
 """Git utilities."""
 
 import subprocess
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
 from workgarden.exceptions import GitError
 
+# Porcelain "worktree list" attribute lines and the dict keys they map to
+WORKTREE_FIELDS = {"worktree": "path", "HEAD": "head", "branch": "branch"}
+WORKTREE_FLAGS = frozenset(("bare", "detached"))
+
+
+def _parse_worktree_record(record: str) -> dict:
+    """Parse one record of git worktree list --porcelain output."""
+    worktree: dict = {}
+    for line in record.split("\n"):
+        label, _, value = line.partition(" ")
+        key = WORKTREE_FIELDS.get(label)
+        if key is not None:
+            worktree[key] = value
+        elif label in WORKTREE_FLAGS:
+            worktree[label] = True
+    if "branch" in worktree:
+        worktree["branch"] = worktree["branch"].removeprefix("refs/heads/")
+    return worktree
+
 
 class GitUtils:
     """Git operations helper."""
 
     def __init__(self, repo_path: Path | None = None):
         self.repo_path = repo_path or Path.cwd()
-
-    def _run(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
-        """Run a git command."""
+        # repo_path never changes, so these answers are looked up once
+        self._is_git_repo: bool | None = None
+        self._repo_name: str | None = None
+
+    def _run(
+        self, *args: str, check: bool = True, capture: bool = True
+    ) -> subprocess.CompletedProcess:
+        """Run a git command.
+
+        With capture=False stdout is discarded instead of read back; stderr is
+        still captured for error messages.
+        """
         cmd = ["git", "-C", str(self.repo_path), *args]
+        stdout = subprocess.PIPE if capture else subprocess.DEVNULL
         try:
-            return subprocess.run(cmd, capture_output=True, text=True, check=check)
+            return subprocess.run(
+                cmd, stdout=stdout, stderr=subprocess.PIPE, text=True, check=check
+            )
         except subprocess.CalledProcessError as e:
             raise GitError(f"Git command failed: {e.stderr.strip()}") from e
 
     def is_git_repo(self) -> bool:
         """Check if current directory is a git repository."""
-        result = self._run("rev-parse", "--git-dir", check=False)
-        return result.returncode == 0
+        if self._is_git_repo is None:
+            result = self._run("rev-parse", "--git-dir", check=False)
+            self._is_git_repo = result.returncode == 0
+        return self._is_git_repo
 
     def get_repo_name(self) -> str:
         """Get the repository name from remote or directory."""
+        if self._repo_name is None:
+            self._repo_name = self._lookup_repo_name()
+        return self._repo_name
+
+    def _lookup_repo_name(self) -> str:
+        """Derive the repository name from the origin URL, falling back to the directory."""
         result = self._run("remote", "get-url", "origin", check=False)
         if result.returncode == 0:
             url = result.stdout.strip()
@@ -43,40 +84,41 @@ class GitUtils:
 
     def branch_exists(self, branch: str) -> bool:
         """Check if a branch exists (local or remote)."""
-        result = self._run("show-ref", "--verify", f"refs/heads/{branch}", check=False)
-        if result.returncode == 0:
-            return True
-        result = self._run("show-ref", "--verify", f"refs/remotes/origin/{branch}", check=False)
-        return result.returncode == 0
+        return self.branches_exist([branch])[branch]
+
+    def branches_exist(self, branches: Iterable[str]) -> dict[str, bool]:
+        """Check which branches exist (local or remote) with a single git call.
+
+        Returns:
+            Mapping of each branch name to whether it exists
+        """
+        branches = list(branches)
+        if not branches:
+            return {}
+        # Only the requested refs are listed, so the cost doesn't grow with the
+        # repository's ref count. A pattern also matches refs below it
+        # (refs/heads/a matches refs/heads/a/b), hence the exact lookup after.
+        patterns = [
+            ref
+            for branch in branches
+            for ref in (f"refs/heads/{branch}", f"refs/remotes/origin/{branch}")
+        ]
+        result = self._run("for-each-ref", "--format=%(refname)", *patterns, check=False)
+        refs = set(result.stdout.splitlines()) if result.returncode == 0 else set()
+        return {
+            branch: f"refs/heads/{branch}" in refs or f"refs/remotes/origin/{branch}" in refs
+            for branch in branches
+        }
 
     def get_worktree_list(self) -> list[dict]:
         """Get list of all git worktrees."""
         result = self._run("worktree", "list", "--porcelain")
-        worktrees = []
-        current: dict = {}
-
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                if current:
-                    worktrees.append(current)
-                    current = {}
-                continue
-
-            if line.startswith("worktree "):
-                current["path"] = line[9:]
-            elif line.startswith("HEAD "):
-                current["head"] = line[5:]
-            elif line.startswith("branch "):
-                current["branch"] = line[7:].replace("refs/heads/", "")
-            elif line == "bare":
-                current["bare"] = True
-            elif line == "detached":
-                current["detached"] = True
-
-        if current:
-            worktrees.append(current)
-
-        return worktrees
+        # Porcelain output is one blank-line separated record per worktree
+        return [
+            _parse_worktree_record(record)
+            for record in result.stdout.strip().split("\n\n")
+            if record
+        ]
 
     def worktree_add(self, path: Path, branch: str, create_branch: bool = False) -> None:
         """Add a new worktree."""
@@ -85,7 +127,7 @@ class GitUtils:
             args.extend(["-b", branch, str(path)])
         else:
             args.extend([str(path), branch])
-        self._run(*args)
+        self._run(*args, capture=False)
 
     def worktree_remove(self, path: Path, force: bool = False) -> None:
         """Remove a worktree."""
@@ -93,24 +135,28 @@ class GitUtils:
         if force:
             args.append("--force")
         args.append(str(path))
-        self._run(*args)
+        self._run(*args, capture=False)
 
     def delete_branch(self, branch: str, force: bool = False) -> None:
         """Delete a local branch."""
         args = ["branch", "-D" if force else "-d", branch]
-        self._run(*args)
+        self._run(*args, capture=False)
 
     def has_uncommitted_changes(self, path: Path) -> bool:
         """Check if worktree has uncommitted changes."""
         result = subprocess.run(
             ["git", "-C", str(path), "status", "--porcelain"],
             capture_output=True,
-            text=True,
             check=False,
         )
         return bool(result.stdout.strip())
 
 
+# Characters in branch names that become "-" in slugs
+SLUG_TRANSLATION = str.maketrans({"/": "-", "_": "-"})
+
+
+@lru_cache(maxsize=128)
 def get_branch_slug(branch: str) -> str:
     """Convert branch name to slug for directory naming."""
-    return branch.replace("/", "-").replace("_", "-").lower()
+    return branch.translate(SLUG_TRANSLATION).lower()
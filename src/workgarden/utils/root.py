@@ -1,6 +1,7 @@
 """Utilities for finding the main repository root."""
 
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from workgarden.exceptions import RootDetectionError
@@ -21,31 +22,63 @@ def find_main_repo_root(start_path: Path | None = None) -> Path:
     Raises:
         RootDetectionError: If not in a git repository.
     """
-    cwd = start_path or Path.cwd()
+    return _find_main_repo_root(_start_dir(start_path))
 
+
+def _start_dir(start_path: Path | None) -> Path:
+    """Directory to run detection from, in the form used as the cache key.
+
+    Explicit paths are resolved, so relative paths can't hit an entry cached
+    for another working directory and symlinked spellings share one entry.
+    Path.cwd() is already absolute and free of symlinks.
+    """
+    return Path.cwd() if start_path is None else start_path.resolve()
+
+
+@lru_cache(maxsize=8)
+def _get_git_dirs(cwd: Path) -> tuple[Path, Path]:
+    """Resolve the git dir and the shared git common dir for a directory.
+
+    Both come from a single git rev-parse call, memoized per process: several
+    loaders and managers are built per CLI invocation, each resolving the root
+    from the same directory, and only the first one runs git.
+
+    Returns:
+        Tuple of (git_dir, git_common_dir) as absolute paths.
+
+    Raises:
+        RootDetectionError: If not in a git repository.
+    """
     try:
         result = subprocess.run(
-            ["git", "rev-parse", "--git-common-dir"],
+            ["git", "rev-parse", "--git-dir", "--git-common-dir"],
             cwd=cwd,
             capture_output=True,
             text=True,
             check=True,
         )
-        git_common_dir = result.stdout.strip()
     except subprocess.CalledProcessError:
         raise RootDetectionError("Not in a git repository")
 
-    # git-common-dir returns the path to the shared .git directory
-    # For main repo: ".git"
-    # For worktree: "/absolute/path/to/main-repo/.git"
-    git_common_path = Path(git_common_dir)
+    # One line per flag, in the order requested. Relative paths (like ".git"
+    # in the main repo) are relative to cwd; in a worktree git-dir points to
+    # .git/worktrees/<name> and git-common-dir to the main repo's .git
+    git_dir, git_common_dir = result.stdout.splitlines()[:2]
+    return _absolute(cwd, git_dir), _absolute(cwd, git_common_dir)
 
-    # If it's a relative path (like ".git"), resolve it relative to cwd
-    if not git_common_path.is_absolute():
-        git_common_path = (cwd / git_common_path).resolve()
 
-    # The main repo root is the parent of the .git directory
-    return git_common_path.parent
+def _absolute(cwd: Path, git_path: str) -> Path:
+    """Resolve a path printed by git rev-parse against the directory it ran in."""
+    path = Path(git_path)
+    if not path.is_absolute():
+        path = (cwd / path).resolve()
+    return path
+
+
+def _find_main_repo_root(cwd: Path) -> Path:
+    """Resolve the main repo root for a directory."""
+    # The main repo root is the parent of the shared .git directory
+    return _get_git_dirs(cwd)[1].parent
 
 
 def is_inside_worktree(start_path: Path | None = None) -> bool:
@@ -60,41 +93,6 @@ def is_inside_worktree(start_path: Path | None = None) -> bool:
     Raises:
         RootDetectionError: If not in a git repository.
     """
-    cwd = start_path or Path.cwd()
-
-    try:
-        # Get git-dir (current repo's .git path)
-        git_dir_result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        git_dir = git_dir_result.stdout.strip()
-
-        # Get git-common-dir (shared .git directory)
-        git_common_result = subprocess.run(
-            ["git", "rev-parse", "--git-common-dir"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        git_common_dir = git_common_result.stdout.strip()
-    except subprocess.CalledProcessError:
-        raise RootDetectionError("Not in a git repository")
-
-    # Resolve both to absolute paths for comparison
-    git_dir_path = Path(git_dir)
-    git_common_path = Path(git_common_dir)
-
-    if not git_dir_path.is_absolute():
-        git_dir_path = (cwd / git_dir_path).resolve()
-    if not git_common_path.is_absolute():
-        git_common_path = (cwd / git_common_path).resolve()
-
-    # In a worktree, git-dir points to .git/worktrees/<name>
-    # while git-common-dir points to the main repo's .git
+    git_dir, git_common_dir = _get_git_dirs(_start_dir(start_path))
     # They're different if we're in a worktree
-    return git_dir_path != git_common_path
+    return git_dir != git_common_dir
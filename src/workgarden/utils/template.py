@@ -3,9 +3,20 @@
 import re
 from pathlib import Path
 
+# Match {{VARIABLE}} pattern
+VARIABLE_PATTERN = re.compile(r"\{\{([A-Z_][A-Z0-9_]*)\}\}")
+
+# Match {variable} pattern (lowercase)
+PATH_VARIABLE_PATTERN = re.compile(r"\{([a-z_]+)\}")
+
 
 class TemplateContext:
-    """Context for template variable substitution."""
+    """Context for template variable substitution.
+
+    The variables dict is computed once and cached in `substitutions`; assigning
+    any attribute invalidates it. Mutating port_mappings or custom_variables in
+    place is not tracked - reassign them instead.
+    """
 
     def __init__(
         self,
@@ -23,6 +34,18 @@ class TemplateContext:
         self.port_mappings = port_mappings or {}
         self.custom_variables = custom_variables or {}
 
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_substitutions", None)
+
+    @property
+    def substitutions(self) -> dict[str, str]:
+        """Cached result of get_variables(); treat as read-only."""
+        if self._substitutions is None:
+            self._substitutions = self.get_variables()
+        return self._substitutions
+
     def get_variables(self) -> dict[str, str]:
         """Get all available variables for substitution."""
         variables = {
@@ -44,19 +67,23 @@ class TemplateContext:
 
 def substitute_variables(text: str, context: TemplateContext) -> str:
     """Substitute {{VARIABLE}} placeholders in text."""
-    variables = context.get_variables()
+    if "{{" not in text:
+        return text
+
+    variables = context.substitutions
 
     def replace(match: re.Match) -> str:
         var_name = match.group(1)
         return variables.get(var_name, match.group(0))
 
-    # Match {{VARIABLE}} pattern
-    pattern = r"\{\{([A-Z_][A-Z0-9_]*)\}\}"
-    return re.sub(pattern, replace, text)
+    return VARIABLE_PATTERN.sub(replace, text)
 
 
 def substitute_path_variables(path_template: str, context: TemplateContext) -> str:
     """Substitute {variable} placeholders in path templates."""
+    if "{" not in path_template:
+        return path_template
+
     variables = {
         "repo_name": context.repo_name,
         "branch": context.branch,
@@ -67,6 +94,4 @@ def substitute_path_variables(path_template: str, context: TemplateContext) -> s
         var_name = match.group(1)
         return variables.get(var_name, match.group(0))
 
-    # Match {variable} pattern (lowercase)
-    pattern = r"\{([a-z_]+)\}"
-    return re.sub(pattern, replace, path_template)
+    return PATH_VARIABLE_PATTERN.sub(replace, path_template)
@@ -1,50 +1,51 @@
 """Shared pytest fixtures for workgarden tests."""
 
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
 import pytest
 
+from tests.fakes import FakeGitUtils
 
-@pytest.fixture
-def temp_git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository with initial commit."""
-    repo_path = tmp_path / "test-repo"
-    repo_path.mkdir()
 
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the config cache at a per-test directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.delenv("WG_NO_CACHE", raising=False)
+    return cache_home / "workgarden"
 
-    # Create initial commit
-    (repo_path / "README.md").write_text("# Test Repo\n")
-    subprocess.run(["git", "add", "."], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
 
-    return repo_path
+@pytest.fixture(autouse=True)
+def isolated_git_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep git calls made during a test away from the global/system git config."""
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
 
 
-@pytest.fixture
-def temp_git_repo_with_config(temp_git_repo: Path) -> Path:
-    """Create a temporary git repository with workgarden config."""
-    config_content = """\
+@pytest.fixture(autouse=True)
+def fresh_editor_detection():
+    """Don't let cached editor detection leak between tests."""
+    from workgarden.utils.editor import _detect_editors, _which
+
+    _detect_editors.cache_clear()
+    _which.cache_clear()
+    yield
+    _detect_editors.cache_clear()
+    _which.cache_clear()
+
+
+# Keep session fixture git calls independent of the developer's global/system
+# config (signing, hooks, templates), which also spares parsing it on every
+# call; they run before isolated_git_config can set the environment
+FIXTURE_GIT_ENV = {**os.environ, "GIT_CONFIG_GLOBAL": os.devnull, "GIT_CONFIG_NOSYSTEM": "1"}
+
+TEST_USER_CONFIG = "[user]\n\temail = test@test.com\n\tname = Test User\n"
+
+TEST_CONFIG = """\
 version: "1.0"
 worktree_base_path: "../{repo_name}-worktrees"
 worktree_naming: "{branch_slug}"
@@ -70,35 +71,105 @@ editor:
   command: "code"
   auto_open: false
 """
-    (temp_git_repo / ".workgarden.yaml").write_text(config_content)
+
+
+@pytest.fixture(scope="session")
+def prototype_git_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the git repository with initial commit that temp_git_repo copies."""
+    repo_path = tmp_path_factory.mktemp("prototype") / "test-repo"
+    repo_path.mkdir()
+
+    # Initialize git repo; the identity is appended to .git/config directly
+    # rather than with two more `git config` processes
+    subprocess.run(["git", "init", "--quiet"], cwd=repo_path, env=FIXTURE_GIT_ENV, check=True)
+    with open(repo_path / ".git" / "config", "a") as f:
+        f.write(TEST_USER_CONFIG)
+
+    # Create initial commit
+    (repo_path / "README.md").write_text("# Test Repo\n")
+    subprocess.run(["git", "add", "."], cwd=repo_path, env=FIXTURE_GIT_ENV, check=True)
+    subprocess.run(
+        ["git", "commit", "--quiet", "-m", "Initial commit"],
+        cwd=repo_path,
+        env=FIXTURE_GIT_ENV,
+        check=True,
+    )
+
+    return repo_path
+
+
+@pytest.fixture
+def temp_git_repo(prototype_git_repo: Path, tmp_path: Path) -> Path:
+    """Create a temporary git repository with initial commit.
+
+    The repository is a plain copy of a session-wide prototype, so tests don't
+    pay for git init/commit. A copy (unlike git clone --local) has no origin
+    remote or remote-tracking branches, exactly like a freshly initialized repo.
+    """
+    return shutil.copytree(prototype_git_repo, tmp_path / "test-repo", symlinks=True)
+
+
+@pytest.fixture
+def temp_git_repo_with_config(temp_git_repo: Path) -> Path:
+    """Create a temporary git repository with workgarden config."""
+    (temp_git_repo / ".workgarden.yaml").write_text(TEST_CONFIG)
     return temp_git_repo
 
 
 @pytest.fixture
-def chdir_to_repo(temp_git_repo_with_config: Path):
+def chdir_to_repo(temp_git_repo_with_config: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Change directory to the test repo for the duration of the test."""
-    original_dir = os.getcwd()
-    os.chdir(temp_git_repo_with_config)
-    yield temp_git_repo_with_config
-    os.chdir(original_dir)
+    monkeypatch.chdir(temp_git_repo_with_config)
+    return temp_git_repo_with_config
+
+
+@pytest.fixture(scope="session")
+def prototype_git_repo_with_worktree(
+    prototype_git_repo: Path, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, Path]:
+    """Create the repository and linked worktree that temp_git_repo_with_worktree copies."""
+    base = tmp_path_factory.mktemp("prototype-worktree")
+    main_repo = shutil.copytree(prototype_git_repo, base / "test-repo", symlinks=True)
+    worktree_path = base / "test-worktree"
+
+    subprocess.run(
+        ["git", "worktree", "add", "--quiet", "-b", "test-branch", str(worktree_path)],
+        cwd=main_repo,
+        env=FIXTURE_GIT_ENV,
+        check=True,
+    )
+
+    return main_repo, worktree_path
 
 
 @pytest.fixture
-def temp_git_repo_with_worktree(temp_git_repo_with_config: Path) -> tuple[Path, Path]:
-    """Create a temporary git repository with a worktree.
+def temp_git_repo_with_worktree(
+    prototype_git_repo_with_worktree: tuple[Path, Path], tmp_path: Path
+) -> tuple[Path, Path]:
+    """Create a temporary git repository with workgarden config and a worktree.
+
+    Both directories are copied from a session-wide prototype. Git links a
+    worktree and its repository through absolute paths, so the two link
+    files are rewritten to point at the copies.
 
     Returns:
         Tuple of (main_repo_path, worktree_path)
     """
-    main_repo = temp_git_repo_with_config
-    worktree_path = main_repo.parent / "test-worktree"
+    prototype_repo, prototype_worktree = prototype_git_repo_with_worktree
+    main_repo = shutil.copytree(prototype_repo, tmp_path / "test-repo", symlinks=True)
+    worktree_path = shutil.copytree(prototype_worktree, tmp_path / "test-worktree", symlinks=True)
 
-    # Create a branch and worktree
-    subprocess.run(
-        ["git", "worktree", "add", "-b", "test-branch", str(worktree_path)],
-        cwd=main_repo,
-        capture_output=True,
-        check=True,
-    )
+    admin_dir = main_repo / ".git" / "worktrees" / worktree_path.name
+    (worktree_path / ".git").write_text(f"gitdir: {admin_dir}\n")
+    (admin_dir / "gitdir").write_text(f"{worktree_path / '.git'}\n")
 
+    (main_repo / ".workgarden.yaml").write_text(TEST_CONFIG)
     return main_repo, worktree_path
+
+
+@pytest.fixture
+def fake_git(chdir_to_repo: Path, monkeypatch: pytest.MonkeyPatch) -> FakeGitUtils:
+    """Run WorktreeManager against an in-memory git fake instead of real git."""
+    fake = FakeGitUtils(chdir_to_repo)
+    monkeypatch.setattr("workgarden.core.worktree.GitUtils", lambda repo_path=None: fake)
+    return fake
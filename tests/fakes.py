@@ -0,0 +1,66 @@
+"""In-memory stand-ins for slow collaborators in tests."""
+
+import shutil
+from collections.abc import Iterable
+from pathlib import Path
+
+from workgarden.exceptions import GitError
+
+
+class FakeGitUtils:
+    """GitUtils replacement that tracks branches and worktrees in memory.
+
+    Worktree directories are still created on disk, so path checks and
+    worktree_remove() behave like real git, but no git process is started.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self.branches: set[str] = {"main"}
+        self.worktrees: dict[Path, str] = {}
+        self.dirty: set[Path] = set()
+
+    def mark_dirty(self, path: Path) -> None:
+        """Make has_uncommitted_changes() report changes for a worktree."""
+        self.dirty.add(path)
+
+    def is_git_repo(self) -> bool:
+        return True
+
+    def get_repo_name(self) -> str:
+        return self.repo_path.name
+
+    def branch_exists(self, branch: str) -> bool:
+        return branch in self.branches
+
+    def branches_exist(self, branches: Iterable[str]) -> dict[str, bool]:
+        return {branch: branch in self.branches for branch in branches}
+
+    def worktree_add(self, path: Path, branch: str, create_branch: bool = False) -> None:
+        if create_branch:
+            if branch in self.branches:
+                raise GitError(f"Git command failed: a branch named '{branch}' already exists")
+            self.branches.add(branch)
+        elif branch not in self.branches:
+            raise GitError(f"Git command failed: invalid reference: {branch}")
+        path.mkdir(parents=True)
+        self.worktrees[path] = branch
+
+    def worktree_remove(self, path: Path, force: bool = False) -> None:
+        if path not in self.worktrees:
+            raise GitError(f"Git command failed: '{path}' is not a working tree")
+        if path in self.dirty and not force:
+            raise GitError(f"Git command failed: '{path}' contains modified or untracked files")
+        shutil.rmtree(path)
+        del self.worktrees[path]
+        self.dirty.discard(path)
+
+    def delete_branch(self, branch: str, force: bool = False) -> None:
+        if branch not in self.branches:
+            raise GitError(f"Git command failed: branch '{branch}' not found")
+        if branch in self.worktrees.values():
+            raise GitError(f"Git command failed: branch '{branch}' is checked out")
+        self.branches.remove(branch)
+
+    def has_uncommitted_changes(self, path: Path) -> bool:
+        return path in self.dirty
@@ -1,22 +1,121 @@
 """Tests for CLI commands."""
 
 import json
-import os
+import sys
+from datetime import datetime
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
+from tests.fakes import FakeGitUtils
+from workgarden import __version__
 from workgarden.cli.app import app
+from workgarden.cli.entry import run
+from workgarden.core.worktree import CreateOptions, WorktreeManager
+from workgarden.models.state import StateManager
+from workgarden.models.worktree import WorktreeInfo
+from workgarden.utils.git import get_branch_slug
 
 runner = CliRunner()
 
 
+def _add_worktree(fake_git: FakeGitUtils, branch: str) -> WorktreeInfo:
+    """Register a worktree with the git fake and the state file as test setup.
+
+    Skips WorktreeManager.create() (config loading and git worktree add) for
+    tests that only need an existing worktree to remove or list.
+    """
+    repo = fake_git.repo_path
+    path = repo.parent / f"{repo.name}-worktrees" / get_branch_slug(branch)
+    fake_git.worktree_add(path, branch, create_branch=True)
+
+    worktree = WorktreeInfo(path=path, branch=branch)
+    state = StateManager(repo)
+    state.add_worktree(worktree.slug, worktree)
+    state.flush()
+    return worktree
+
+
+class TestApp:
+    """Tests for the top-level application."""
+
+    def test_help_lists_all_commands(self):
+        """Test that top-level help lists every subcommand."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ("config", "create", "remove", "list", "open"):
+            assert name in result.output
+
+    def test_subcommand_help(self):
+        """Test that subcommand help is resolved through the lazy group."""
+        result = runner.invoke(app, ["list", "--help"])
+
+        assert result.exit_code == 0
+        assert "--json" in result.output
+
+    def test_version(self):
+        """Test --version prints the package version."""
+        result = runner.invoke(app, ["--version"])
+
+        assert result.exit_code == 0
+        assert __version__ in result.output
+
+
+class TestEntryFastPaths:
+    """Tests for the static fast paths in the console entry point."""
+
+    def test_help(self, capsys):
+        """Test --help is answered from the static command table."""
+        run(["--help"])
+        out = capsys.readouterr().out
+
+        assert "Usage:" in out
+        for name in ("config", "create", "remove", "list", "open"):
+            assert name in out
+
+    def test_no_args_shows_help(self, capsys):
+        """Test running without arguments shows help."""
+        run([])
+
+        assert "Commands:" in capsys.readouterr().out
+
+    def test_version(self, capsys):
+        """Test --version and -V print the version."""
+        run(["--version"])
+        run(["-V"])
+
+        assert capsys.readouterr().out.count(__version__) == 2
+
+    def test_list_json(self, chdir_to_repo: Path, capsys):
+        """Test list --json is dispatched directly."""
+        run(["list", "--json"])
+
+        assert capsys.readouterr().out.strip() == "{}"
+
+    def test_list_json_without_config_exits(self, temp_git_repo: Path, monkeypatch):
+        """Test the direct list --json path exits with the command's exit code."""
+        monkeypatch.chdir(temp_git_repo)
+
+        with pytest.raises(SystemExit) as exc_info:
+            run(["list", "--json"])
+
+        assert exc_info.value.code == 1
+
+    def test_list_editors(self, capsys):
+        """Test open --list-editors works without a repository."""
+        run(["open", "--list-editors"])
+
+        assert "Available Editors" in capsys.readouterr().out
+
+
 class TestCreateCommand:
     """Tests for the create command."""
 
-    def test_create_requires_config(self, temp_git_repo: Path):
+    def test_create_requires_config(self, temp_git_repo: Path, monkeypatch: pytest.MonkeyPatch):
         """Test that create fails without config file."""
-        os.chdir(temp_git_repo)
+        monkeypatch.chdir(temp_git_repo)
         result = runner.invoke(app, ["create", "test-branch"])
 
         assert result.exit_code == 1
@@ -31,6 +130,7 @@ class TestCreateCommand:
         assert "SKIPPED" in result.output
         assert "no changes made" in result.output.lower()
 
+    @pytest.mark.slow
     def test_create_success(self, chdir_to_repo: Path):
         """Test successful worktree creation."""
         result = runner.invoke(app, ["create", "test-feature"])
@@ -38,25 +138,22 @@ class TestCreateCommand:
         assert result.exit_code == 0
         assert "Worktree created at" in result.output
 
-    def test_create_duplicate_fails(self, chdir_to_repo: Path):
+    def test_create_duplicate_fails(self, fake_git: FakeGitUtils):
         """Test that creating duplicate worktree fails."""
-        # Create first
-        result1 = runner.invoke(app, ["create", "test-feature"])
-        assert result1.exit_code == 0
+        _add_worktree(fake_git, "test-feature")
 
-        # Try duplicate
-        result2 = runner.invoke(app, ["create", "test-feature"])
-        assert result2.exit_code == 1
-        assert "already exists" in result2.output
+        result = runner.invoke(app, ["create", "test-feature"])
+        assert result.exit_code == 1
+        assert "already exists" in result.output
 
-    def test_create_shows_progress(self, chdir_to_repo: Path):
+    def test_create_shows_progress(self, fake_git: FakeGitUtils):
         """Test that create shows progress output."""
         result = runner.invoke(app, ["create", "test-progress"])
 
         assert result.exit_code == 0
         assert "OK" in result.output
 
-    def test_create_with_no_hooks(self, chdir_to_repo: Path):
+    def test_create_with_no_hooks(self, fake_git: FakeGitUtils):
         """Test create with --no-hooks flag."""
         result = runner.invoke(app, ["create", "test-skiphooks", "--no-hooks"])
 
@@ -69,25 +166,25 @@ class TestCreateCommand:
 class TestRemoveCommand:
     """Tests for the remove command."""
 
-    def test_remove_requires_config(self, temp_git_repo: Path):
+    def test_remove_requires_config(self, temp_git_repo: Path, monkeypatch: pytest.MonkeyPatch):
         """Test that remove fails without config file."""
-        os.chdir(temp_git_repo)
+        monkeypatch.chdir(temp_git_repo)
         result = runner.invoke(app, ["remove", "test-branch"])
 
         assert result.exit_code == 1
         assert "No .workgarden.yaml found" in result.output
 
-    def test_remove_nonexistent_fails(self, chdir_to_repo: Path):
+    def test_remove_nonexistent_fails(self, fake_git: FakeGitUtils):
         """Test that removing nonexistent worktree fails."""
         result = runner.invoke(app, ["remove", "nonexistent", "-y"])
 
         assert result.exit_code == 1
         assert "not found" in result.output.lower()
 
-    def test_remove_with_confirmation(self, chdir_to_repo: Path):
+    def test_remove_with_confirmation(self, fake_git: FakeGitUtils):
         """Test remove with confirmation prompt."""
         # Create worktree first
-        runner.invoke(app, ["create", "test-remove"])
+        _add_worktree(fake_git, "test-remove")
 
         # Remove with confirmation (simulate 'y' input)
         result = runner.invoke(app, ["remove", "test-remove"], input="y\n")
@@ -95,20 +192,21 @@ class TestRemoveCommand:
         assert result.exit_code == 0
         assert "Worktree removed" in result.output
 
+    @pytest.mark.slow
     def test_remove_with_yes_flag(self, chdir_to_repo: Path):
         """Test remove with --yes flag skips confirmation."""
         # Create worktree first
-        runner.invoke(app, ["create", "test-remove-yes"])
+        assert WorktreeManager().create(CreateOptions(branch="test-remove-yes")).success
 
         result = runner.invoke(app, ["remove", "test-remove-yes", "-y"])
 
         assert result.exit_code == 0
         assert "Worktree removed" in result.output
 
-    def test_remove_cancelled(self, chdir_to_repo: Path):
+    def test_remove_cancelled(self, fake_git: FakeGitUtils):
         """Test remove can be cancelled."""
         # Create worktree first
-        runner.invoke(app, ["create", "test-cancel"])
+        _add_worktree(fake_git, "test-cancel")
 
         # Cancel removal
         result = runner.invoke(app, ["remove", "test-cancel"], input="n\n")
@@ -116,18 +214,11 @@ class TestRemoveCommand:
         assert result.exit_code == 0
         assert "Cancelled" in result.output
 
-    def test_remove_with_uncommitted_changes_fails(self, chdir_to_repo: Path):
+    def test_remove_with_uncommitted_changes_fails(self, fake_git: FakeGitUtils):
         """Test remove fails with uncommitted changes."""
-        # Create worktree
-        create_result = runner.invoke(app, ["create", "test-dirty"])
-        assert create_result.exit_code == 0
-
-        # Get worktree path from state and add changes
-        from workgarden.core.worktree import WorktreeManager
-
-        manager = WorktreeManager()
-        worktree = manager.state.get_worktree("test-dirty")
-        (worktree.path / "dirty.txt").write_text("uncommitted")
+        # Create worktree and add changes
+        worktree = _add_worktree(fake_git, "test-dirty")
+        fake_git.mark_dirty(worktree.path)
 
         # Try to remove
         result = runner.invoke(app, ["remove", "test-dirty", "-y"])
@@ -135,18 +226,11 @@ class TestRemoveCommand:
         assert result.exit_code == 1
         assert "uncommitted" in result.output.lower()
 
-    def test_remove_force_with_uncommitted_changes(self, chdir_to_repo: Path):
+    def test_remove_force_with_uncommitted_changes(self, fake_git: FakeGitUtils):
         """Test remove --force works with uncommitted changes."""
-        # Create worktree
-        create_result = runner.invoke(app, ["create", "test-force"])
-        assert create_result.exit_code == 0
-
-        # Get worktree path from state and add changes
-        from workgarden.core.worktree import WorktreeManager
-
-        manager = WorktreeManager()
-        worktree = manager.state.get_worktree("test-force")
-        (worktree.path / "dirty.txt").write_text("uncommitted")
+        # Create worktree and add changes
+        worktree = _add_worktree(fake_git, "test-force")
+        fake_git.mark_dirty(worktree.path)
 
         # Remove with force
         result = runner.invoke(app, ["remove", "test-force", "--force", "-y"])
@@ -158,26 +242,26 @@ class TestRemoveCommand:
 class TestListCommand:
     """Tests for the list command."""
 
-    def test_list_requires_config(self, temp_git_repo: Path):
+    def test_list_requires_config(self, temp_git_repo: Path, monkeypatch: pytest.MonkeyPatch):
         """Test that list fails without config file."""
-        os.chdir(temp_git_repo)
+        monkeypatch.chdir(temp_git_repo)
         result = runner.invoke(app, ["list"])
 
         assert result.exit_code == 1
         assert "No .workgarden.yaml found" in result.output
 
-    def test_list_empty(self, chdir_to_repo: Path):
+    def test_list_empty(self, fake_git: FakeGitUtils):
         """Test listing with no worktrees."""
         result = runner.invoke(app, ["list"])
 
         assert result.exit_code == 0
         assert "No worktrees found" in result.output
 
-    def test_list_with_worktrees(self, chdir_to_repo: Path):
+    def test_list_with_worktrees(self, fake_git: FakeGitUtils):
         """Test listing worktrees shows table."""
         # Create worktrees
-        runner.invoke(app, ["create", "feature-one"])
-        runner.invoke(app, ["create", "feature-two"])
+        _add_worktree(fake_git, "feature-one")
+        _add_worktree(fake_git, "feature-two")
 
         result = runner.invoke(app, ["list"])
 
@@ -188,17 +272,17 @@ class TestListCommand:
         assert "Path" in result.output
         assert "Status" in result.output
 
-    def test_list_json_output_empty(self, chdir_to_repo: Path):
+    def test_list_json_output_empty(self, fake_git: FakeGitUtils):
         """Test JSON output with no worktrees."""
         result = runner.invoke(app, ["list", "--json"])
 
         assert result.exit_code == 0
         assert result.output.strip() == "{}"
 
-    def test_list_json_output_with_worktrees(self, chdir_to_repo: Path):
+    def test_list_json_output_with_worktrees(self, fake_git: FakeGitUtils):
         """Test JSON output with worktrees."""
         # Create worktree
-        runner.invoke(app, ["create", "feature-json"])
+        _add_worktree(fake_git, "feature-json")
 
         result = runner.invoke(app, ["list", "--json"])
 
@@ -209,30 +293,35 @@ class TestListCommand:
         assert "path" in data["feature-json"]
         assert "status" in data["feature-json"]
 
-    def test_list_shows_status(self, chdir_to_repo: Path):
+    def test_list_shows_status(self, fake_git: FakeGitUtils):
         """Test that list shows worktree status."""
         # Create worktree
-        create_result = runner.invoke(app, ["create", "feature-status"])
-        assert create_result.exit_code == 0
+        _add_worktree(fake_git, "feature-status")
 
         result = runner.invoke(app, ["list"])
 
         assert result.exit_code == 0
         assert "OK" in result.output
 
-    def test_list_shows_modified_status(self, chdir_to_repo: Path):
+    def test_list_shows_modified_status(self, fake_git: FakeGitUtils):
         """Test that list shows Modified status."""
-        # Create worktree
-        runner.invoke(app, ["create", "feature-modified"])
-
-        # Get worktree path and make changes
-        from workgarden.core.worktree import WorktreeManager
-
-        manager = WorktreeManager()
-        worktree = manager.state.get_worktree("feature-modified")
-        (worktree.path / "change.txt").write_text("modified")
+        # Create worktree and make changes
+        worktree = _add_worktree(fake_git, "feature-modified")
+        fake_git.mark_dirty(worktree.path)
 
         result = runner.invoke(app, ["list"])
 
         assert result.exit_code == 0
         assert "Modified" in result.output
+
+    def test_list_json_without_orjson(self, fake_git: FakeGitUtils, monkeypatch):
+        """Test JSON output falls back to the stdlib encoder."""
+        _add_worktree(fake_git, "feature-stdlib")
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        result = runner.invoke(app, ["list", "--json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)["feature-stdlib"]
+        assert data["status"] == "OK"
+        assert data["created_at"] == datetime.fromisoformat(data["created_at"]).isoformat()
@@ -0,0 +1,192 @@
+"""Tests for config loading and the on-disk config cache."""
+
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from workgarden.config import cache
+from workgarden.config.loader import ConfigLoader
+from workgarden.config.schema import DEFAULT_CONFIG, WorkgardenConfig
+from workgarden.exceptions import ConfigNotFoundError, ConfigValidationError
+
+
+def _write_config(root: Path, content: str) -> Path:
+    config_path = root / ".workgarden.yaml"
+    config_path.write_text(content)
+    return config_path
+
+
+class TestConfigLoader:
+    """Tests for ConfigLoader.load()."""
+
+    def test_missing_config_raises(self, tmp_path: Path):
+        """Should raise ConfigNotFoundError when no config file exists."""
+        with pytest.raises(ConfigNotFoundError):
+            ConfigLoader(tmp_path).load()
+
+    def test_loads_values(self, tmp_path: Path):
+        """Should parse values from the config file."""
+        _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+
+        config = ConfigLoader(tmp_path).load()
+
+        assert config.worktree_naming == "{branch}"
+
+    def test_empty_config_uses_defaults(self, tmp_path: Path):
+        """Should return the default config for an empty file."""
+        _write_config(tmp_path, "")
+
+        assert ConfigLoader(tmp_path).load() == WorkgardenConfig()
+
+    def test_invalid_config_raises(self, tmp_path: Path):
+        """Should raise ConfigValidationError for invalid values."""
+        _write_config(tmp_path, "docker_compose:\n  ports:\n    base_port: not-a-port\n")
+
+        with pytest.raises(ConfigValidationError):
+            ConfigLoader(tmp_path).load()
+
+    def test_unknown_parallel_hook_event_raises(self, tmp_path: Path):
+        """Should reject a misspelled event in hooks.parallel instead of ignoring it."""
+        _write_config(tmp_path, "hooks:\n  parallel: [post_craete]\n")
+
+        with pytest.raises(ConfigValidationError):
+            ConfigLoader(tmp_path).load()
+
+
+class TestConfigCache:
+    """Tests for the on-disk config cache."""
+
+    def test_load_writes_cache_entry(self, tmp_path: Path, isolated_cache_dir: Path):
+        """Should store the validated config in the cache directory."""
+        _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+
+        ConfigLoader(tmp_path).load()
+
+        assert len(list(isolated_cache_dir.glob("config-*.pkl"))) == 1
+
+    def test_cache_hit_returns_same_config(self, tmp_path: Path):
+        """Should return an equal config from the cache on the second load."""
+        _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+
+        first = ConfigLoader(tmp_path).load()
+        second = ConfigLoader(tmp_path).load()
+
+        assert second == first
+
+    def test_edit_invalidates_cache(self, tmp_path: Path):
+        """Should reparse the file after it changes."""
+        config_path = _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+        ConfigLoader(tmp_path).load()
+
+        config_path.write_text("worktree_naming: '{branch_slug}-wt'\n")
+
+        assert ConfigLoader(tmp_path).load().worktree_naming == "{branch_slug}-wt"
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        """Should fall back to parsing when the cache entry is unreadable."""
+        config_path = _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+        cache_path = cache.get_cache_path(config_path, os.stat(config_path))
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(b"garbage")
+
+        assert ConfigLoader(tmp_path).load().worktree_naming == "{branch}"
+
+    def test_cache_hit_skips_validation(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Should not parse or validate again on a cache hit."""
+        _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+        ConfigLoader(tmp_path).load()
+
+        def fail_parse(self):
+            raise AssertionError("config was reparsed")
+
+        monkeypatch.setattr(ConfigLoader, "_parse", fail_parse)
+
+        assert ConfigLoader(tmp_path).load().worktree_naming == "{branch}"
+
+    def test_repeat_load_in_process_skips_cache_read(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should reuse the config already loaded by this process."""
+        _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+        first = ConfigLoader(tmp_path).load()
+
+        def fail_read(cache_path):
+            raise AssertionError("cache entry was read again")
+
+        monkeypatch.setattr("workgarden.config.loader.read_cached_config", fail_read)
+
+        assert ConfigLoader(tmp_path).load() is first
+
+    def test_header_mismatch_is_a_miss(self, tmp_path: Path):
+        """Should ignore entries written by another cache format."""
+        config_path = _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+        cache_path = cache.get_cache_path(config_path, os.stat(config_path))
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(b"WG0:old\n" + pickle.dumps(WorkgardenConfig()))
+
+        assert ConfigLoader(tmp_path).load().worktree_naming == "{branch}"
+
+    def test_wrong_type_is_a_miss(self, tmp_path: Path):
+        """Should ignore entries that don't hold a WorkgardenConfig."""
+        config_path = _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+        cache_path = cache.get_cache_path(config_path, os.stat(config_path))
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(cache.CACHE_HEADER + pickle.dumps({"not": "a config"}))
+
+        assert ConfigLoader(tmp_path).load().worktree_naming == "{branch}"
+
+    def test_no_cache_env_disables_cache(
+        self, tmp_path: Path, isolated_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should not touch the cache when WG_NO_CACHE=1."""
+        monkeypatch.setenv("WG_NO_CACHE", "1")
+        _write_config(tmp_path, "worktree_naming: '{branch}'\n")
+
+        ConfigLoader(tmp_path).load()
+
+        assert not isolated_cache_dir.exists()
+
+    def test_evicts_oldest_entries(
+        self, tmp_path: Path, isolated_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should keep at most CACHE_MAX_ENTRIES entries."""
+        monkeypatch.setattr(cache, "CACHE_MAX_ENTRIES", 2)
+        for i in range(3):
+            repo = tmp_path / f"repo-{i}"
+            repo.mkdir()
+            _write_config(repo, "version: '1.0'\n")
+            ConfigLoader(repo).load()
+
+        assert len(list(isolated_cache_dir.glob("config-*.pkl"))) == 2
+
+
+class TestToYamlDict:
+    """Tests for WorkgardenConfig.to_yaml_dict()."""
+
+    def test_default_config_matches_model_dump(self):
+        """Cached default dump should match a fresh dump."""
+        assert DEFAULT_CONFIG.to_yaml_dict() == DEFAULT_CONFIG.model_dump(mode="json")
+
+    def test_custom_config_is_dumped(self):
+        """Non-default configs should reflect their own values."""
+        config = WorkgardenConfig(worktree_naming="{branch}")
+
+        assert config.to_yaml_dict()["worktree_naming"] == "{branch}"
+
+
+class TestFrozenConfig:
+    """Tests for config model immutability."""
+
+    def test_default_config_is_frozen(self):
+        """Shared default config should reject attribute assignment."""
+        with pytest.raises(ValidationError):
+            DEFAULT_CONFIG.editor.auto_open = True
+
+    def test_default_lists_are_not_shared(self):
+        """Each instance should get its own default list."""
+        assert WorkgardenConfig().environment.copy_files is not (
+            WorkgardenConfig().environment.copy_files
+        )
@@ -1,9 +1,17 @@
 """Tests for console utilities."""
 
+import io
+from collections.abc import Iterator
+from unittest.mock import patch
 
+import pytest
 
 from workgarden.utils.console import (
+    OperationProgressReporter,
+    console,
     create_table,
+    error_console,
+    print_config_panel,
     print_dry_run_banner,
     print_error,
     print_info,
@@ -13,73 +21,72 @@ from workgarden.utils.console import (
 )
 
 
-class TestPrintFunctions:
-    """Tests for print helper functions."""
+@pytest.fixture
+def console_output() -> Iterator[dict[str, io.StringIO]]:
+    """Point the shared consoles at in-memory buffers ("out" and "err")."""
+    buffers = {"out": io.StringIO(), "err": io.StringIO()}
+    console.file, error_console.file = buffers["out"], buffers["err"]
+    yield buffers
+    # None makes Rich fall back to the current sys.stdout/sys.stderr again
+    console.file = error_console.file = None
 
-    def test_print_error(self, capsys):
-        """Test print_error outputs to stderr."""
-        print_error("test error message")
-        captured = capsys.readouterr()
-        assert "Error:" in captured.err
-        assert "test error message" in captured.err
-
-    def test_print_success(self, capsys):
-        """Test print_success outputs success message."""
-        print_success("test success")
-        captured = capsys.readouterr()
-        assert "test success" in captured.out
 
-    def test_print_warning(self, capsys):
-        """Test print_warning outputs warning message."""
-        print_warning("test warning")
-        captured = capsys.readouterr()
-        assert "Warning:" in captured.out
-        assert "test warning" in captured.out
+class TestPrintFunctions:
+    """Tests for print helper functions."""
 
-    def test_print_info(self, capsys):
-        """Test print_info outputs info message."""
-        print_info("test info")
-        captured = capsys.readouterr()
-        assert "test info" in captured.out
+    @pytest.mark.parametrize(
+        ("print_function", "label", "stream"),
+        [
+            (print_error, "Error:", "err"),
+            (print_success, "✓", "out"),
+            (print_warning, "Warning:", "out"),
+            (print_info, "ℹ", "out"),
+        ],
+    )
+    def test_prints_labelled_message(
+        self, console_output: dict[str, io.StringIO], print_function, label: str, stream: str
+    ):
+        """Test each helper prints its label and message to the right stream."""
+        print_function("test message")
+        output = console_output[stream].getvalue()
+        assert label in output
+        assert "test message" in output
 
 
 class TestPrintOperationStatus:
     """Tests for print_operation_status function."""
 
-    def test_status_starting(self, capsys):
-        """Test starting status output."""
-        print_operation_status("Test operation", "starting")
-        captured = capsys.readouterr()
-        assert "..." in captured.out
-        assert "Test operation" in captured.out
-
-    def test_status_completed(self, capsys):
-        """Test completed status output."""
-        print_operation_status("Test operation", "completed")
-        captured = capsys.readouterr()
-        assert "OK" in captured.out
-        assert "Test operation" in captured.out
-
-    def test_status_failed(self, capsys):
-        """Test failed status output."""
-        print_operation_status("Test operation", "failed")
-        captured = capsys.readouterr()
-        assert "FAILED" in captured.out
-        assert "Test operation" in captured.out
-
-    def test_status_rolling_back(self, capsys):
-        """Test rolling_back status output."""
-        print_operation_status("Test operation", "rolling_back")
-        captured = capsys.readouterr()
-        assert "ROLLBACK" in captured.out
-        assert "Test operation" in captured.out
-
-    def test_status_skipped(self, capsys):
-        """Test skipped status output."""
-        print_operation_status("Test operation", "skipped")
-        captured = capsys.readouterr()
-        assert "SKIPPED" in captured.out
-        assert "Test operation" in captured.out
+    @pytest.mark.parametrize(
+        ("status", "marker"),
+        [
+            ("starting", "..."),
+            ("completed", "OK"),
+            ("failed", "FAILED"),
+            ("rolling_back", "ROLLBACK"),
+            ("skipped", "SKIPPED"),
+        ],
+    )
+    def test_status_output(self, console_output: dict[str, io.StringIO], status: str, marker: str):
+        """Test each status prints its marker and the operation name."""
+        print_operation_status("Test operation", status)
+        output = console_output["out"].getvalue()
+        assert marker in output
+        assert "Test operation" in output
+
+    def test_name_printed_literally(self, console_output: dict[str, io.StringIO]):
+        """Test square brackets in the name are not treated as markup."""
+        print_operation_status("Run hook [bold]x[/bold]", "completed")
+        assert "Run hook [bold]x[/bold]" in console_output["out"].getvalue()
+
+    def test_prefix_not_mutated(self, console_output: dict[str, io.StringIO]):
+        """Test the shared prefix is reused without accumulating names."""
+        print_operation_status("first", "completed")
+        print_operation_status("second", "completed")
+        assert "first" not in console_output["out"].getvalue().splitlines()[1]
+
+    def test_benchmark_status_line(self, console_output: dict[str, io.StringIO], benchmark):
+        """Benchmark printing a single status line."""
+        benchmark(print_operation_status, "Copy environment files", "completed")
 
 
 class TestPrintDryRunBanner:
@@ -93,6 +100,56 @@ class TestPrintDryRunBanner:
         assert "No changes will be made" in captured.out
 
 
+class TestPrintConfigPanel:
+    """Tests for print_config_panel."""
+
+    def test_config_rendered_as_yaml(self, capsys):
+        """Test config values are rendered as YAML in key order."""
+        print_config_panel({"version": "1.0", "hooks": {"post_create": ["make"]}})
+        captured = capsys.readouterr()
+        assert "version: '1.0'" in captured.out
+        assert "post_create:" in captured.out
+        assert "- make" in captured.out
+        assert captured.out.index("version") < captured.out.index("hooks")
+
+    def test_yaml_dump_memoized(self, capsys):
+        """Test an equal config is only dumped to YAML once."""
+        config = {"version": "1.0", "hooks": {"post_create": ["make", "test"]}}
+        print_config_panel(config)
+        with patch("yaml.dump") as dump:
+            print_config_panel(dict(config))
+        dump.assert_not_called()
+        assert capsys.readouterr().out.count("- test") == 2
+
+    def test_syntax_theme_loaded_once(self, capsys):
+        """Test the monokai theme is reused across renders."""
+        from rich.syntax import Syntax
+
+        print_config_panel({"a": 1})
+        with patch.object(Syntax, "get_theme", wraps=Syntax.get_theme) as get_theme:
+            print_config_panel({"b": 2})
+        # Only rich's own passthrough of the already-built theme
+        assert all(not isinstance(call.args[0], str) for call in get_theme.call_args_list)
+
+    def test_distinguishes_dicts_from_lists_of_pairs(self, capsys):
+        """Test structurally different configs are not confused by the cache."""
+        print_config_panel({"items": {"a": 1}})
+        print_config_panel({"items": [["a", 1]]})
+        captured = capsys.readouterr()
+        assert "a: 1" in captured.out
+        assert "- - a" in captured.out
+
+    def test_distinguishes_equal_scalars_of_different_types(self, capsys):
+        """Test True, 1 and 1.0 leaves are not confused by the cache."""
+        print_config_panel({"value": True})
+        print_config_panel({"value": 1})
+        print_config_panel({"value": 1.0})
+        captured = capsys.readouterr()
+        assert "value: true" in captured.out
+        assert "value: 1 " in captured.out
+        assert "value: 1.0" in captured.out
+
+
 class TestCreateTable:
     """Tests for create_table function."""
 
@@ -109,3 +166,35 @@ class TestCreateTable:
         table.add_row("val1", "val2")
 
         assert table.row_count == 1
+
+
+class TestOperationProgressReporter:
+    """Tests for OperationProgressReporter."""
+
+    def test_final_lines_buffered_until_flush(self, capsys):
+        """Test consecutive final statuses are printed together on flush."""
+        reporter = OperationProgressReporter()
+        reporter("op1", "failed")
+        reporter("op2", "rolling_back")
+
+        assert capsys.readouterr().out == ""
+
+        reporter.flush()
+        captured = capsys.readouterr()
+        assert "FAILED" in captured.out
+        assert "ROLLBACK" in captured.out
+        assert captured.out.index("op1") < captured.out.index("op2")
+
+    def test_starting_flushes_previous_lines(self, capsys):
+        """Test that starting an operation prints the buffered lines first."""
+        reporter = OperationProgressReporter()
+        reporter("op1", "completed")
+        reporter("op2", "starting")
+        reporter.flush()
+
+        assert "OK op1" in capsys.readouterr().out
+
+    def test_unknown_status_raises(self):
+        """Test that an unknown status is rejected."""
+        with pytest.raises(ValueError):
+            OperationProgressReporter()("op", "warning")
@@ -1,150 +1,220 @@
 """Tests for editor utilities."""
 
+import shlex
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
 from workgarden.exceptions import EditorError
+from workgarden.utils import editor
 from workgarden.utils.editor import (
     KNOWN_EDITORS,
     EditorInfo,
     detect_available_editors,
+    detect_available_editors_map,
     get_available_editors,
     get_default_editor,
     open_editor,
 )
 
 
+def _install(monkeypatch: pytest.MonkeyPatch, *commands: str) -> list[str]:
+    """Make shutil.which find only the given commands.
+
+    Returns:
+        List that records every command looked up
+    """
+    lookups: list[str] = []
+
+    def which(cmd: str, path: str | None = None) -> str | None:
+        lookups.append(cmd)
+        return f"/usr/bin/{cmd}" if cmd in commands else None
+
+    monkeypatch.setattr(editor.shutil, "which", which)
+    return lookups
+
+
+@pytest.fixture
+def popen_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[tuple, dict]]:
+    """Record subprocess.Popen calls made by open_editor instead of launching."""
+    calls: list[tuple[tuple, dict]] = []
+    monkeypatch.setattr(editor.subprocess, "Popen", lambda *a, **kw: calls.append((a, kw)))
+    return calls
+
+
 class TestDetectAvailableEditors:
     """Tests for detect_available_editors."""
 
-    def test_returns_all_known_editors(self):
+    def test_returns_all_known_editors(self, monkeypatch: pytest.MonkeyPatch):
         """Should return info for all known editors."""
-        with patch("workgarden.utils.editor.shutil.which", return_value=None):
-            editors = detect_available_editors()
-            assert len(editors) == len(KNOWN_EDITORS)
+        _install(monkeypatch)
+        editors = detect_available_editors()
+        assert len(editors) == len(KNOWN_EDITORS)
 
-    def test_marks_installed_editors_as_available(self):
+    def test_marks_installed_editors_as_available(self, monkeypatch: pytest.MonkeyPatch):
         """Should mark editors found in PATH as available."""
+        _install(monkeypatch, "code")
+
+        editors = detect_available_editors_map()
+
+        assert editors["code"].available is True
+        assert editors["vim"].available is False
+        assert list(editors.values()) == list(detect_available_editors())
+
+    def test_detection_is_cached(self, monkeypatch: pytest.MonkeyPatch):
+        """Should search PATH only once while PATH is unchanged."""
+        lookups = _install(monkeypatch)
+
+        first = detect_available_editors()
+        second = detect_available_editors()
+
+        assert first is second
+        assert len(lookups) == len(KNOWN_EDITORS)
+
+    def test_redetects_when_path_changes(self, monkeypatch: pytest.MonkeyPatch):
+        """Should not reuse results cached for a different PATH."""
+
+        def which(cmd: str, path: str | None = None) -> str | None:
+            return "/opt/bin/zed" if cmd == "zed" and path == "/opt/bin" else None
+
+        monkeypatch.setattr(editor.shutil, "which", which)
+        monkeypatch.setenv("PATH", "/usr/bin")
+        before = {e.command for e in get_available_editors()}
+        monkeypatch.setenv("PATH", "/opt/bin")
+        after = {e.command for e in get_available_editors()}
 
-        def mock_which(cmd):
-            return "/usr/bin/code" if cmd == "code" else None
+        assert before == set()
+        assert after == {"zed"}
 
-        with patch("workgarden.utils.editor.shutil.which", side_effect=mock_which):
-            editors = detect_available_editors()
-            code_editor = next(e for e in editors if e.command == "code")
-            vim_editor = next(e for e in editors if e.command == "vim")
+    def test_benchmark_uncached_detection(self, benchmark):
+        """Benchmark detection as a fresh CLI process runs it, searching PATH."""
 
-            assert code_editor.available is True
-            assert vim_editor.available is False
+        def clear_caches():
+            editor._detect_editors.cache_clear()
+            editor._which.cache_clear()
+
+        benchmark.pedantic(detect_available_editors, setup=clear_caches, rounds=100)
 
 
 class TestGetAvailableEditors:
     """Tests for get_available_editors."""
 
-    def test_returns_only_available_editors(self):
+    def test_returns_only_available_editors(self, monkeypatch: pytest.MonkeyPatch):
         """Should filter to only available editors."""
+        _install(monkeypatch, "code", "vim")
 
-        def mock_which(cmd):
-            return "/usr/bin/code" if cmd in ("code", "vim") else None
-
-        with patch("workgarden.utils.editor.shutil.which", side_effect=mock_which):
-            editors = get_available_editors()
-            assert all(e.available for e in editors)
-            commands = [e.command for e in editors]
-            assert "code" in commands
-            assert "vim" in commands
+        editors = get_available_editors()
+        assert all(e.available for e in editors)
+        commands = [e.command for e in editors]
+        assert "code" in commands
+        assert "vim" in commands
 
-    def test_returns_empty_list_when_none_available(self):
+    def test_returns_empty_list_when_none_available(self, monkeypatch: pytest.MonkeyPatch):
         """Should return empty list when no editors installed."""
-        with patch("workgarden.utils.editor.shutil.which", return_value=None):
-            editors = get_available_editors()
-            assert editors == []
+        _install(monkeypatch)
+        assert get_available_editors() == []
 
 
 class TestGetDefaultEditor:
     """Tests for get_default_editor priority order."""
 
-    def test_config_takes_priority(self):
+    def test_config_takes_priority(self, monkeypatch: pytest.MonkeyPatch):
         """Config editor should take priority over everything."""
-        with patch.dict("os.environ", {"VISUAL": "emacs", "EDITOR": "vim"}):
-            result = get_default_editor(config_editor="cursor")
-            assert result == "cursor"
+        monkeypatch.setenv("VISUAL", "emacs")
+        monkeypatch.setenv("EDITOR", "vim")
+        assert get_default_editor(config_editor="cursor") == "cursor"
 
-    def test_visual_env_second_priority(self):
+    def test_visual_env_second_priority(self, monkeypatch: pytest.MonkeyPatch):
         """$VISUAL should be used when no config."""
-        with patch.dict("os.environ", {"VISUAL": "code", "EDITOR": "vim"}):
-            result = get_default_editor(config_editor=None)
-            assert result == "code"
+        monkeypatch.setenv("VISUAL", "code")
+        monkeypatch.setenv("EDITOR", "vim")
+        assert get_default_editor(config_editor=None) == "code"
 
-    def test_editor_env_third_priority(self):
+    def test_editor_env_third_priority(self, monkeypatch: pytest.MonkeyPatch):
         """$EDITOR should be used when no config or $VISUAL."""
-        with patch.dict("os.environ", {"EDITOR": "vim"}, clear=True):
-            # Clear VISUAL explicitly
-            with patch.dict("os.environ", {"VISUAL": ""}, clear=False):
-                import os
+        monkeypatch.delenv("VISUAL", raising=False)
+        monkeypatch.setenv("EDITOR", "vim")
+        assert get_default_editor(config_editor=None) == "vim"
 
-                os.environ.pop("VISUAL", None)
-                result = get_default_editor(config_editor=None)
-                assert result == "vim"
-
-    def test_auto_detect_fourth_priority(self):
+    def test_auto_detect_fourth_priority(self, monkeypatch: pytest.MonkeyPatch):
         """Should auto-detect when no config or env vars."""
+        monkeypatch.delenv("VISUAL", raising=False)
+        monkeypatch.delenv("EDITOR", raising=False)
+        _install(monkeypatch, "zed")
+        assert get_default_editor(config_editor=None) == "zed"
 
-        def mock_which(cmd):
-            return "/usr/bin/zed" if cmd == "zed" else None
-
-        with patch.dict("os.environ", {}, clear=True):
-            with patch("workgarden.utils.editor.shutil.which", side_effect=mock_which):
-                result = get_default_editor(config_editor=None)
-                assert result == "zed"
-
-    def test_returns_none_when_nothing_available(self):
+    def test_returns_none_when_nothing_available(self, monkeypatch: pytest.MonkeyPatch):
         """Should return None when no editor available."""
-        with patch.dict("os.environ", {}, clear=True):
-            with patch("workgarden.utils.editor.shutil.which", return_value=None):
-                result = get_default_editor(config_editor=None)
-                assert result is None
+        monkeypatch.delenv("VISUAL", raising=False)
+        monkeypatch.delenv("EDITOR", raising=False)
+        _install(monkeypatch)
+        assert get_default_editor(config_editor=None) is None
 
 
 class TestOpenEditor:
     """Tests for open_editor."""
 
-    def test_raises_error_when_no_editor(self):
+    def test_raises_error_when_no_editor(self, monkeypatch: pytest.MonkeyPatch):
         """Should raise EditorError when no editor available."""
-        with patch("workgarden.utils.editor.get_default_editor", return_value=None):
-            with pytest.raises(EditorError, match="No editor available"):
-                open_editor(Path("/some/path"))
+        monkeypatch.setattr(editor, "get_default_editor", lambda: None)
+        with pytest.raises(EditorError, match="No editor available"):
+            open_editor(Path("/some/path"))
 
-    def test_raises_error_when_editor_not_found(self):
+    def test_raises_error_when_editor_not_found(self, monkeypatch: pytest.MonkeyPatch):
         """Should raise EditorError when editor not in PATH."""
-        with patch("workgarden.utils.editor.shutil.which", return_value=None):
-            with pytest.raises(EditorError, match="not found in PATH"):
-                open_editor(Path("/some/path"), "nonexistent-editor")
+        _install(monkeypatch)
+        with pytest.raises(EditorError, match="not found in PATH"):
+            open_editor(Path("/some/path"), "nonexistent-editor")
 
-    def test_launches_editor_with_popen(self, tmp_path: Path):
+    def test_launches_editor_with_popen(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, popen_calls: list
+    ):
         """Should launch editor using subprocess.Popen."""
-        mock_popen = MagicMock()
+        _install(monkeypatch, "code")
+
+        open_editor(tmp_path, "code")
 
-        with patch("workgarden.utils.editor.shutil.which", return_value="/usr/bin/code"):
-            with patch("workgarden.utils.editor.subprocess.Popen", mock_popen):
-                open_editor(tmp_path, "code")
+        [(args, kwargs)] = popen_calls
+        assert args[0] == ["code", str(tmp_path)]
+        assert kwargs["start_new_session"] is True
 
-        mock_popen.assert_called_once()
-        call_args = mock_popen.call_args
-        assert call_args[0][0] == ["code", str(tmp_path)]
-        assert call_args[1]["start_new_session"] is True
+    def test_reuses_detection_path_lookup(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, popen_calls: list
+    ):
+        """Should not search PATH again for an editor found by detection."""
+        monkeypatch.delenv("VISUAL", raising=False)
+        monkeypatch.delenv("EDITOR", raising=False)
+        lookups = _install(monkeypatch, *(command for _, command in KNOWN_EDITORS))
 
-    def test_handles_oserror(self, tmp_path: Path):
+        open_editor(tmp_path)
+
+        assert len(lookups) == len(KNOWN_EDITORS)
+
+    @pytest.mark.parametrize(
+        "command",
+        ["code --wait", "  nvim\t-p  ", "'/opt/My Editor/bin/edit' -n", r"emacs\ client -c"],
+    )
+    def test_splits_command_like_shlex(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, popen_calls: list, command: str
+    ):
+        """Should split plain and quoted editor commands the way shlex does."""
+        _install(monkeypatch, shlex.split(command)[0])
+
+        open_editor(tmp_path, command)
+
+        [(args, _kwargs)] = popen_calls
+        assert args[0] == [*shlex.split(command), str(tmp_path)]
+
+    def test_handles_oserror(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         """Should wrap OSError in EditorError."""
-        with patch("workgarden.utils.editor.shutil.which", return_value="/usr/bin/code"):
-            with patch(
-                "workgarden.utils.editor.subprocess.Popen",
-                side_effect=OSError("Permission denied"),
-            ):
-                with pytest.raises(EditorError, match="Failed to launch editor"):
-                    open_editor(tmp_path, "code")
+        _install(monkeypatch, "code")
+
+        def failing_popen(*args, **kwargs):
+            raise OSError("Permission denied")
+
+        monkeypatch.setattr(editor.subprocess, "Popen", failing_popen)
+        with pytest.raises(EditorError, match="Failed to launch editor"):
+            open_editor(tmp_path, "code")
 
 
 class TestEditorInfo:
@@ -168,11 +238,11 @@ class TestKnownEditors:
         assert "vim" in commands
         assert "cursor" in commands
 
-    def test_known_editors_format(self):
+    @pytest.mark.parametrize("entry", KNOWN_EDITORS, ids=[command for _, command in KNOWN_EDITORS])
+    def test_known_editors_format(self, entry):
         """Each entry should be a (name, command) tuple."""
-        for entry in KNOWN_EDITORS:
-            assert isinstance(entry, tuple)
-            assert len(entry) == 2
-            name, command = entry
-            assert isinstance(name, str)
-            assert isinstance(command, str)
+        assert isinstance(entry, tuple)
+        assert len(entry) == 2
+        name, command = entry
+        assert isinstance(name, str)
+        assert isinstance(command, str)
@@ -0,0 +1,116 @@
+"""Tests for git utilities."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from workgarden.exceptions import GitError
+from workgarden.utils.git import GitUtils
+
+
+class TestBranchesExist:
+    """Tests for batched branch existence checks."""
+
+    @pytest.mark.slow
+    def test_local_and_remote_branches(self, temp_git_repo: Path):
+        """Should find local branches and origin remote-tracking refs."""
+        git = GitUtils(temp_git_repo)
+        git.worktree_add(temp_git_repo.parent / "wt", "feature/a", create_branch=True)
+        subprocess.run(
+            ["git", "update-ref", "refs/remotes/origin/remote-only", "HEAD"],
+            cwd=temp_git_repo,
+            check=True,
+        )
+
+        result = git.branches_exist(["feature/a", "remote-only", "feature", "missing"])
+
+        assert result == {
+            "feature/a": True,
+            "remote-only": True,
+            "feature": False,
+            "missing": False,
+        }
+
+    def test_single_git_call(self, temp_git_repo: Path):
+        """Should check any number of branches with one subprocess."""
+        git = GitUtils(temp_git_repo)
+
+        with patch("workgarden.utils.git.subprocess.run", wraps=subprocess.run) as run:
+            git.branches_exist(["a", "b", "c"])
+
+        assert run.call_count == 1
+
+    def test_lists_only_requested_refs(self, temp_git_repo: Path):
+        """Should pass the requested refs to git rather than listing every branch."""
+        git = GitUtils(temp_git_repo)
+
+        with patch("workgarden.utils.git.subprocess.run", wraps=subprocess.run) as run:
+            assert git.branch_exists("feature") is False
+
+        assert run.call_args.args[0][-2:] == ["refs/heads/feature", "refs/remotes/origin/feature"]
+
+    def test_outside_repo(self, tmp_path: Path):
+        """Should report no branches outside a git repository."""
+        assert GitUtils(tmp_path).branch_exists("main") is False
+
+
+class TestGitUtilsCaching:
+    """Tests for per-instance caching of repository facts."""
+
+    def test_repo_facts_looked_up_once(self, temp_git_repo: Path):
+        """Should run git once for repeated is_git_repo/get_repo_name calls."""
+        git = GitUtils(temp_git_repo)
+
+        with patch("workgarden.utils.git.subprocess.run", wraps=subprocess.run) as run:
+            assert git.is_git_repo() is git.is_git_repo() is True
+            assert git.get_repo_name() == git.get_repo_name() == "test-repo"
+
+        assert run.call_count == 2
+
+
+class TestGetWorktreeList:
+    """Tests for parsing git worktree list output."""
+
+    @pytest.mark.slow
+    def test_parses_records(self, temp_git_repo: Path):
+        """Should return one dict per worktree with short branch names."""
+        git = GitUtils(temp_git_repo)
+        worktree_path = temp_git_repo.parent / "wt"
+        git.worktree_add(worktree_path, "feature/refs/heads/x", create_branch=True)
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(temp_git_repo.parent / "detached")],
+            cwd=temp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+
+        worktrees = {Path(wt["path"]).name: wt for wt in git.get_worktree_list()}
+        feature, detached = worktrees["wt"], worktrees["detached"]
+
+        assert set(worktrees) == {"test-repo", "wt", "detached"}
+        assert feature["branch"] == "feature/refs/heads/x"
+        assert len(feature["head"]) == 40
+        assert detached["detached"] is True
+        assert "branch" not in detached
+
+
+class TestRun:
+    """Tests for running git commands."""
+
+    def test_uncaptured_failure_keeps_stderr(self, temp_git_repo: Path):
+        """Should report git's error message even when stdout is discarded."""
+        git = GitUtils(temp_git_repo)
+
+        with pytest.raises(GitError, match="not found"):
+            git.delete_branch("does-not-exist")
+
+    def test_has_uncommitted_changes(self, temp_git_repo: Path):
+        """Should detect untracked files in a worktree."""
+        git = GitUtils(temp_git_repo)
+        assert git.has_uncommitted_changes(temp_git_repo) is False
+
+        (temp_git_repo / "new.txt").write_text("x")
+
+        assert git.has_uncommitted_changes(temp_git_repo) is True
@@ -1,14 +1,38 @@
 """Tests for HookRunner and lifecycle hooks."""
 
+import subprocess
 from pathlib import Path
 
 import pytest
 
-from workgarden.core.hooks import HookResult, HookRunner, HookRunnerResult
+from workgarden.core import hooks
+from workgarden.core.hooks import HookResult, HookRunner, HookRunnerResult, _simple_argv
 from workgarden.exceptions import HookError
 from workgarden.utils.template import TemplateContext
 
 
+@pytest.fixture
+def context() -> TemplateContext:
+    """Template context for tests that don't depend on its values."""
+    return TemplateContext(branch="test", branch_slug="test")
+
+
+@pytest.fixture
+def hook_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[object, dict]]:
+    """Record the subprocess.run calls made for hooks instead of starting processes.
+
+    Every recorded hook succeeds with empty output.
+    """
+    calls: list[tuple[object, dict]] = []
+
+    def fake_run(args, **kwargs):
+        calls.append((args, kwargs))
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(hooks.subprocess, "run", fake_run)
+    return calls
+
+
 class TestHookResult:
     """Tests for HookResult dataclass."""
 
@@ -75,9 +99,8 @@ class TestHookRunnerResult:
 class TestHookRunner:
     """Tests for HookRunner class."""
 
-    def test_run_empty_hooks_list(self, tmp_path: Path):
+    def test_run_empty_hooks_list(self, tmp_path: Path, context: TemplateContext):
         """Test that running empty hooks list succeeds."""
-        context = TemplateContext(branch="test", branch_slug="test")
         runner = HookRunner(context=context, working_dir=tmp_path)
 
         result = runner.run("post_create", [])
@@ -86,7 +109,7 @@ class TestHookRunner:
         assert result.hook_name == "post_create"
         assert result.results == []
 
-    def test_run_single_hook(self, tmp_path: Path):
+    def test_run_single_hook(self, tmp_path: Path, hook_calls: list):
         """Test running a single hook command."""
         context = TemplateContext(branch="test-branch", branch_slug="test-branch")
         runner = HookRunner(context=context, working_dir=tmp_path)
@@ -96,11 +119,10 @@ class TestHookRunner:
         assert result.success is True
         assert len(result.results) == 1
         assert result.results[0].success is True
-        assert "hello" in result.results[0].stdout
+        assert [args for args, _kwargs in hook_calls] == [("echo", "hello")]
 
-    def test_run_multiple_hooks(self, tmp_path: Path):
-        """Test running multiple hook commands."""
-        context = TemplateContext(branch="test", branch_slug="test")
+    def test_run_multiple_hooks(self, tmp_path: Path, hook_calls: list, context: TemplateContext):
+        """Test running multiple hook commands in order."""
         runner = HookRunner(context=context, working_dir=tmp_path)
 
         result = runner.run("post_setup", ["echo first", "echo second", "echo third"])
@@ -108,8 +130,9 @@ class TestHookRunner:
         assert result.success is True
         assert len(result.results) == 3
         assert all(r.success for r in result.results)
+        assert [args[1] for args, _kwargs in hook_calls] == ["first", "second", "third"]
 
-    def test_variable_substitution(self, tmp_path: Path):
+    def test_variable_substitution(self, tmp_path: Path, hook_calls: list):
         """Test that {{VARIABLE}} placeholders are substituted."""
         context = TemplateContext(
             branch="feature/my-branch",
@@ -122,11 +145,9 @@ class TestHookRunner:
         result = runner.run("post_create", ["echo {{BRANCH}} {{BRANCH_SLUG}} {{REPO_NAME}}"])
 
         assert result.success is True
-        assert "feature/my-branch" in result.results[0].stdout
-        assert "feature-my-branch" in result.results[0].stdout
-        assert "test-repo" in result.results[0].stdout
+        assert result.results[0].command == "echo feature/my-branch feature-my-branch test-repo"
 
-    def test_port_variable_substitution(self, tmp_path: Path):
+    def test_port_variable_substitution(self, tmp_path: Path, hook_calls: list):
         """Test that PORT_* variables are substituted."""
         context = TemplateContext(
             branch="test",
@@ -138,10 +159,9 @@ class TestHookRunner:
         result = runner.run("post_setup", ["echo {{PORT_WEB}} {{PORT_DB}}"])
 
         assert result.success is True
-        assert "8080" in result.results[0].stdout
-        assert "5432" in result.results[0].stdout
+        assert result.results[0].command == "echo 8080 5432"
 
-    def test_environment_variables_exposed(self, tmp_path: Path):
+    def test_environment_variables_exposed(self, tmp_path: Path, hook_calls: list):
         """Test that WG_* environment variables are exposed to hooks."""
         context = TemplateContext(
             branch="test-branch",
@@ -150,13 +170,13 @@ class TestHookRunner:
         )
         runner = HookRunner(context=context, working_dir=tmp_path)
 
-        # Use printenv to check environment variables
         result = runner.run("post_create", ["printenv WG_BRANCH"])
 
         assert result.success is True
-        assert "test-branch" in result.results[0].stdout
+        [(_args, kwargs)] = hook_calls
+        assert kwargs["env"]["WG_BRANCH"] == "test-branch"
 
-    def test_all_wg_environment_variables(self, tmp_path: Path):
+    def test_all_wg_environment_variables(self, tmp_path: Path, hook_calls: list):
         """Test that all expected WG_* variables are set."""
         context = TemplateContext(
             branch="test",
@@ -167,25 +187,68 @@ class TestHookRunner:
         )
         runner = HookRunner(context=context, working_dir=tmp_path)
 
-        # Create a script to check all variables
-        script = """
-        echo "BRANCH=$WG_BRANCH"
-        echo "SLUG=$WG_BRANCH_SLUG"
-        echo "REPO=$WG_REPO_NAME"
-        echo "PORT=$WG_PORT_API"
-        """
-        result = runner.run("test", [f"bash -c '{script}'"])
+        result = runner.run("test", ["env"])
 
         assert result.success is True
-        output = result.results[0].stdout
-        assert "BRANCH=test" in output
-        assert "SLUG=test-slug" in output
-        assert "REPO=repo" in output
-        assert "PORT=3000" in output
+        [(_args, kwargs)] = hook_calls
+        env = kwargs["env"]
+        assert env["WG_BRANCH"] == "test"
+        assert env["WG_BRANCH_SLUG"] == "test-slug"
+        assert env["WG_REPO_NAME"] == "repo"
+        assert env["WG_PORT_API"] == "3000"
+
+    def test_env_allowlist_filters_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, context: TemplateContext
+    ):
+        """Test that only allowlisted variables (plus WG_*) reach hooks."""
+        monkeypatch.setenv("WG_TEST_KEEP", "1")
+        monkeypatch.setenv("LC_WG_TEST", "2")
+        monkeypatch.setenv("WG_TEST_DROP_ME", "3")
+        runner = HookRunner(
+            context=context, working_dir=tmp_path, env_allowlist=["PATH", "WG_TEST_KEEP", "LC_*"]
+        )
+
+        env = runner.env
+
+        assert env["WG_TEST_KEEP"] == "1"
+        assert env["LC_WG_TEST"] == "2"
+        assert env["WG_BRANCH"] == "test"
+        assert "WG_TEST_DROP_ME" not in env
+        assert runner.run("post_create", ["printenv LC_WG_TEST"]).results[0].stdout == "2\n"
+
+    def test_env_allowlist_wildcard_keeps_full_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, context: TemplateContext
+    ):
+        """Test that a "*" entry passes the whole environment through."""
+        monkeypatch.setenv("WG_TEST_ANY", "1")
+        runner = HookRunner(context=context, working_dir=tmp_path, env_allowlist=["*"])
+
+        assert runner.env["WG_TEST_ANY"] == "1"
+
+    def test_environment_built_once(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        hook_calls: list,
+        context: TemplateContext,
+    ):
+        """Test that the hook environment is built once per runner."""
+        runner = HookRunner(context=context, working_dir=tmp_path)
+        calls = []
+        build = runner._build_environment
+
+        def counting_build():
+            calls.append(1)
+            return build()
+
+        monkeypatch.setattr(runner, "_build_environment", counting_build)
+
+        runner.run("post_create", ["true", "true", "true"])
+
+        assert len(calls) == 1
 
-    def test_fail_fast_on_error(self, tmp_path: Path):
+    def test_fail_fast_on_error(self, tmp_path: Path, context: TemplateContext):
         """Test that execution stops on first failure."""
-        context = TemplateContext(branch="test", branch_slug="test")
         runner = HookRunner(context=context, working_dir=tmp_path)
 
         # Create a marker file to track execution
@@ -204,9 +267,8 @@ class TestHookRunner:
         assert "post_create hook failed" in str(exc_info.value)
         assert not marker.exists()  # Third command should not have run
 
-    def test_hook_error_includes_command(self, tmp_path: Path):
+    def test_hook_error_includes_command(self, tmp_path: Path, context: TemplateContext):
         """Test that HookError includes the failed command."""
-        context = TemplateContext(branch="test", branch_slug="test")
         runner = HookRunner(context=context, working_dir=tmp_path)
 
         with pytest.raises(HookError) as exc_info:
@@ -214,17 +276,19 @@ class TestHookRunner:
 
         assert "this-command-does-not-exist-12345" in str(exc_info.value)
 
-    def test_runs_in_working_directory(self, tmp_path: Path):
+    def test_runs_in_working_directory(
+        self, tmp_path: Path, hook_calls: list, context: TemplateContext
+    ):
         """Test that commands run in the specified working directory."""
-        context = TemplateContext(branch="test", branch_slug="test")
         runner = HookRunner(context=context, working_dir=tmp_path)
 
         result = runner.run("post_create", ["pwd"])
 
         assert result.success is True
-        assert str(tmp_path) in result.results[0].stdout
+        [(_args, kwargs)] = hook_calls
+        assert kwargs["cwd"] == tmp_path
 
-    def test_working_dir_defaults_to_worktree_path(self, tmp_path: Path):
+    def test_working_dir_defaults_to_worktree_path(self, tmp_path: Path, hook_calls: list):
         """Test that working_dir defaults to context.worktree_path."""
         context = TemplateContext(
             branch="test",
@@ -236,31 +300,30 @@ class TestHookRunner:
         result = runner.run("post_create", ["pwd"])
 
         assert result.success is True
-        assert str(tmp_path) in result.results[0].stdout
+        [(_args, kwargs)] = hook_calls
+        assert kwargs["cwd"] == tmp_path
 
-    def test_timeout_handling(self, tmp_path: Path):
+    @pytest.mark.parametrize("timeout", [0.1, pytest.param(1, marks=pytest.mark.slow)])
+    def test_timeout_handling(self, tmp_path: Path, context: TemplateContext, timeout: float):
         """Test that commands timeout correctly."""
-        context = TemplateContext(branch="test", branch_slug="test")
-        runner = HookRunner(context=context, working_dir=tmp_path, timeout=1)
+        runner = HookRunner(context=context, working_dir=tmp_path, timeout=timeout)
 
         with pytest.raises(HookError) as exc_info:
             runner.run("post_create", ["sleep 10"])
 
         assert "timed out" in str(exc_info.value).lower()
 
-    def test_stderr_captured(self, tmp_path: Path):
+    def test_stderr_captured(self, tmp_path: Path, context: TemplateContext):
         """Test that stderr is captured."""
-        context = TemplateContext(branch="test", branch_slug="test")
         runner = HookRunner(context=context, working_dir=tmp_path)
 
         result = runner.run("post_create", ["bash -c 'echo error >&2'"])
 
         assert result.success is True
-        assert "error" in result.results[0].stderr
+        assert result.results[0].stderr == "error\n"
 
-    def test_creates_files(self, tmp_path: Path):
+    def test_creates_files(self, tmp_path: Path, context: TemplateContext):
         """Test that hooks can create files in working directory."""
-        context = TemplateContext(branch="test", branch_slug="test")
         runner = HookRunner(context=context, working_dir=tmp_path)
 
         result = runner.run("post_setup", ["touch .setup_complete"])
@@ -286,8 +349,161 @@ class TestHookRunner:
 
         assert result.success is True
         content = (tmp_path / "branch_info.txt").read_text()
-        assert "feature/add-auth" in content
-        assert "myapp" in content
+        assert content == "Branch: feature/add-auth in myapp\n"
+
+
+class TestSimpleArgv:
+    """Tests for deciding which hooks can skip the shell."""
+
+    @pytest.mark.parametrize(
+        "command",
+        ["npm install", "make -j4 build", "git fetch --prune origin", "tool --opt=value"],
+    )
+    def test_plain_commands_split(self, command: str):
+        """Test that plain commands are split on whitespace."""
+        assert _simple_argv(command) == tuple(command.split())
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "echo $HOME",
+            "a && b",
+            "ls *.py",
+            "echo 'quoted arg'",
+            "cat < in.txt",
+            "cd sub",
+            "exit 1",
+            "command -v sh",
+            "type sh",
+            "FOO=bar make",
+            "echo a\necho b",
+            "",
+        ],
+    )
+    def test_shell_commands_rejected(self, command: str):
+        """Test that commands needing shell parsing keep using the shell."""
+        assert _simple_argv(command) is None
+
+    def test_simple_hook_runs_without_shell(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that a plain hook is executed as an argv list."""
+        calls = []
+        real_run = subprocess.run
+
+        def recording_run(args, **kwargs):
+            calls.append((args, kwargs["shell"]))
+            return real_run(args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", recording_run)
+        context = TemplateContext(branch="feature", branch_slug="feature")
+        runner = HookRunner(context=context, working_dir=tmp_path)
+
+        result = runner.run("post_create", ["echo {{BRANCH}}", "echo $WG_BRANCH"])
+
+        assert calls == [(("echo", "feature"), False), ("echo $WG_BRANCH", True)]
+        assert [r.stdout for r in result.results] == ["feature\n", "feature\n"]
+
+    @pytest.mark.parametrize("command", ["command -v sh", "type sh"])
+    def test_builtins_run_in_shell(self, tmp_path: Path, context: TemplateContext, command: str):
+        """Test that builtins with no program on PATH still work as hooks."""
+        runner = HookRunner(context=context, working_dir=tmp_path)
+
+        result = runner.run("post_create", [command])
+
+        assert result.success is True
+        assert "sh" in result.results[0].stdout
+
+    def test_unknown_program_falls_back_to_shell(
+        self, tmp_path: Path, hook_calls: list, context: TemplateContext
+    ):
+        """Test that a command whose program isn't on PATH is left to the shell."""
+        runner = HookRunner(context=context, working_dir=tmp_path)
+
+        runner.run("post_create", ["no-such-program-wg --flag"])
+
+        [(args, kwargs)] = hook_calls
+        assert args == "no-such-program-wg --flag"
+        assert kwargs["shell"] is True
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_script_without_shebang_runs_in_shell(
+        self, tmp_path: Path, context: TemplateContext, parallel: bool
+    ):
+        """Test that an executable script with no shebang line still runs, as sh would."""
+        script = tmp_path / "setup.sh"
+        script.write_text("echo hi\n")
+        script.chmod(0o755)
+        runner = HookRunner(context=context, working_dir=tmp_path)
+
+        result = runner.run("post_create", ["./setup.sh"], parallel=parallel)
+
+        assert result.success is True
+        assert result.results[0].stdout == "hi\n"
+
+
+class TestHookRunnerParallel:
+    """Tests for concurrent hook execution."""
+
+    def test_hooks_run_concurrently(self, tmp_path: Path, context: TemplateContext):
+        """Test that parallel hooks overlap (each waits for the other's marker)."""
+        runner = HookRunner(context=context, working_dir=tmp_path, timeout=5)
+
+        result = runner.run(
+            "post_setup",
+            [
+                "touch a; while [ ! -f b ]; do sleep 0.01; done; echo first",
+                "touch b; while [ ! -f a ]; do sleep 0.01; done; echo second",
+            ],
+            parallel=True,
+        )
+
+        assert result.success is True
+        assert [r.stdout.strip() for r in result.results] == ["first", "second"]
+
+    def test_failure_terminates_running_hooks(self, tmp_path: Path, context: TemplateContext):
+        """Test that the first failure stops hooks still in flight."""
+        runner = HookRunner(context=context, working_dir=tmp_path, timeout=30)
+        marker = tmp_path / "marker.txt"
+
+        with pytest.raises(HookError) as exc_info:
+            runner.run("post_setup", [f"sleep 10 && touch {marker}", "exit 3"], parallel=True)
+
+        assert "exit 3" in str(exc_info.value)
+        assert not marker.exists()
+
+    def test_interrupt_kills_running_hooks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, context: TemplateContext
+    ):
+        """Test that Ctrl-C kills hooks, which run in their own sessions, and re-raises."""
+        launched: list[subprocess.Popen] = []
+        real_popen = subprocess.Popen
+
+        def recording_popen(*args, **kwargs):
+            launched.append(real_popen(*args, **kwargs))
+            return launched[-1]
+
+        def interrupted(futures):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(hooks.subprocess, "Popen", recording_popen)
+        monkeypatch.setattr(hooks, "as_completed", interrupted)
+        runner = HookRunner(context=context, working_dir=tmp_path, timeout=30)
+
+        with pytest.raises(KeyboardInterrupt):
+            runner.run("post_setup", ["sleep 10", "sleep 10"], parallel=True)
+
+        assert [process.returncode for process in launched] == [-9, -9]
+
+    def test_variables_substituted(self, tmp_path: Path):
+        """Test that parallel hooks get substitution and WG_* variables."""
+        context = TemplateContext(branch="feature/x", branch_slug="feature-x")
+        runner = HookRunner(context=context, working_dir=tmp_path)
+
+        result = runner.run(
+            "post_setup", ["echo {{BRANCH_SLUG}}", "printenv WG_BRANCH"], parallel=True
+        )
+
+        assert result.results[0].stdout.strip() == "feature-x"
+        assert result.results[1].stdout.strip() == "feature/x"
 
 
 class TestHookRunnerWithGitRepo:
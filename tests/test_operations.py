@@ -2,11 +2,16 @@
 
 from pathlib import Path
 
+import pytest
+
 from workgarden.core.worktree import (
     CreateWorktreeOperation,
+    DeleteBranchOperation,
     Operation,
     OperationStatus,
+    RemoveFromStateOperation,
     RunHookOperation,
+    SkipOperation,
     TransactionManager,
     UpdateStateOperation,
 )
@@ -16,22 +21,68 @@ from workgarden.utils.git import GitUtils
 from workgarden.utils.template import TemplateContext
 
 
+class RecordingOp(Operation):
+    """Operation that logs "execute <name>"/"rollback <name>" and can be made to fail."""
+
+    def __init__(
+        self,
+        name: str,
+        calls: list[str] | None = None,
+        *,
+        fail: bool = False,
+        fail_rollback: bool = False,
+    ):
+        super().__init__(name)
+        self.calls = calls if calls is not None else []
+        self.fail = fail
+        self.fail_rollback = fail_rollback
+
+    def execute(self):
+        self.calls.append(f"execute {self.name}")
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+
+    def rollback(self):
+        self.calls.append(f"rollback {self.name}")
+        if self.fail_rollback:
+            raise RuntimeError(f"rollback of {self.name} failed")
+
+
+class IrreversibleOp(RecordingOp):
+    """RecordingOp that the transaction must not roll back."""
+
+    can_rollback = False
+
+
+@pytest.fixture
+def state_manager(tmp_path: Path) -> StateManager:
+    """State manager rooted in a plain directory; state operations don't touch git."""
+    return StateManager(tmp_path)
+
+
 class TestOperationStatus:
     """Tests for OperationStatus enum."""
 
-    def test_status_values(self):
-        """Test that all expected status values exist."""
-        assert OperationStatus.PENDING.value == "pending"
-        assert OperationStatus.IN_PROGRESS.value == "in_progress"
-        assert OperationStatus.COMPLETED.value == "completed"
-        assert OperationStatus.FAILED.value == "failed"
-        assert OperationStatus.ROLLED_BACK.value == "rolled_back"
-        assert OperationStatus.SKIPPED.value == "skipped"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (OperationStatus.PENDING, "pending"),
+            (OperationStatus.IN_PROGRESS, "in_progress"),
+            (OperationStatus.COMPLETED, "completed"),
+            (OperationStatus.FAILED, "failed"),
+            (OperationStatus.ROLLED_BACK, "rolled_back"),
+            (OperationStatus.SKIPPED, "skipped"),
+        ],
+    )
+    def test_status_value(self, member: OperationStatus, expected: str):
+        """Test that each expected status value exists."""
+        assert member.value == expected
 
 
 class TestCreateWorktreeOperation:
     """Tests for CreateWorktreeOperation."""
 
+    @pytest.mark.slow
     def test_execute_calls_worktree_add(self, temp_git_repo: Path):
         """Test that execute calls git worktree_add."""
         git = GitUtils(temp_git_repo)
@@ -49,6 +100,7 @@ class TestCreateWorktreeOperation:
         assert worktree_path.exists()
         assert (worktree_path / "README.md").exists()
 
+    @pytest.mark.slow
     def test_rollback_removes_worktree(self, temp_git_repo: Path):
         """Test that rollback removes the created worktree."""
         git = GitUtils(temp_git_repo)
@@ -68,7 +120,7 @@ class TestCreateWorktreeOperation:
         assert not worktree_path.exists()
 
     def test_can_rollback_returns_true(self, temp_git_repo: Path):
-        """Test that can_rollback returns True."""
+        """Test that the operation can be rolled back."""
         git = GitUtils(temp_git_repo)
         op = CreateWorktreeOperation(
             git=git,
@@ -76,17 +128,16 @@ class TestCreateWorktreeOperation:
             branch="test",
             create_branch=True,
         )
-        assert op.can_rollback() is True
+        assert op.can_rollback is True
 
 
 class TestUpdateStateOperation:
     """Tests for UpdateStateOperation."""
 
-    def test_execute_adds_worktree_to_state(self, temp_git_repo: Path):
+    def test_execute_adds_worktree_to_state(self, state_manager: StateManager):
         """Test that execute adds worktree to state."""
-        state_manager = StateManager(temp_git_repo)
         worktree = WorktreeInfo(
-            path=temp_git_repo / "worktrees" / "test",
+            path=state_manager.root_path / "worktrees" / "test",
             branch="test-branch",
         )
 
@@ -101,11 +152,10 @@ class TestUpdateStateOperation:
         assert state_manager.get_worktree("test-branch") is not None
         assert state_manager.get_worktree("test-branch").branch == "test-branch"
 
-    def test_rollback_removes_worktree_from_state(self, temp_git_repo: Path):
+    def test_rollback_removes_worktree_from_state(self, state_manager: StateManager):
         """Test that rollback removes worktree from state."""
-        state_manager = StateManager(temp_git_repo)
         worktree = WorktreeInfo(
-            path=temp_git_repo / "worktrees" / "test",
+            path=state_manager.root_path / "worktrees" / "test",
             branch="test-branch",
         )
 
@@ -121,11 +171,10 @@ class TestUpdateStateOperation:
         op.rollback()
         assert state_manager.get_worktree("test-branch") is None
 
-    def test_can_rollback_returns_true(self, temp_git_repo: Path):
-        """Test that can_rollback returns True."""
-        state_manager = StateManager(temp_git_repo)
+    def test_can_rollback_returns_true(self, state_manager: StateManager):
+        """Test that the operation can be rolled back."""
         worktree = WorktreeInfo(
-            path=temp_git_repo / "worktrees" / "test",
+            path=state_manager.root_path / "worktrees" / "test",
             branch="test-branch",
         )
         op = UpdateStateOperation(
@@ -133,7 +182,37 @@ class TestUpdateStateOperation:
             slug="test-branch",
             worktree=worktree,
         )
-        assert op.can_rollback() is True
+        assert op.can_rollback is True
+
+
+class TestRemoveFromStateOperation:
+    """Tests for RemoveFromStateOperation."""
+
+    def test_rollback_restores_worktree(self, tmp_path: Path):
+        """Test that rollback re-adds the removed worktree."""
+        state_manager = StateManager(tmp_path)
+        worktree = WorktreeInfo(path=tmp_path / "wt", branch="test-branch")
+        state_manager.add_worktree("test-branch", worktree)
+
+        op = RemoveFromStateOperation(state_manager=state_manager, slug="test-branch")
+        op.execute()
+        assert state_manager.get_worktree("test-branch") is None
+
+        op.rollback()
+        assert state_manager.get_worktree("test-branch") == worktree
+
+
+class TestDeleteBranchOperation:
+    """Tests for DeleteBranchOperation."""
+
+    def test_missing_branch_is_skipped(self, temp_git_repo: Path):
+        """Test that a branch git can't delete skips instead of failing."""
+        op = DeleteBranchOperation(git=GitUtils(temp_git_repo), branch="does-not-exist")
+
+        with pytest.raises(SkipOperation):
+            op.execute()
+
+        assert op.can_rollback is False
 
 
 class TestRunHookOperation:
@@ -168,100 +247,81 @@ class TestRunHookOperation:
         op.execute()
 
     def test_can_rollback_returns_false(self):
-        """Test that can_rollback returns False (hooks can't be undone)."""
+        """Test that the operation can't be rolled back (hooks can't be undone)."""
         context = TemplateContext(branch="test", branch_slug="test")
         op = RunHookOperation(
             hook_name="post_create",
             hooks=["echo test"],
             context=context,
         )
-        assert op.can_rollback() is False
+        assert op.can_rollback is False
 
 
 class TestTransactionManager:
     """Tests for TransactionManager."""
 
-    def test_execute_runs_all_operations(self):
-        """Test that execute runs all operations in order."""
-        executed = []
-
-        class MockOp(Operation):
-            def __init__(self, name: str):
-                super().__init__(name)
-
-            def execute(self):
-                executed.append(self.name)
-
-            def rollback(self):
-                pass
-
-        tm = TransactionManager()
-        tm.add(MockOp("op1"))
-        tm.add(MockOp("op2"))
-        tm.add(MockOp("op3"))
+    @pytest.mark.parametrize(
+        ("kinds", "dry_run", "expected_calls"),
+        [
+            pytest.param(
+                "ok ok ok",
+                False,
+                ["execute op0", "execute op1", "execute op2"],
+                id="all-succeed",
+            ),
+            pytest.param(
+                "ok ok fail ok",
+                False,
+                # Rollback in reverse order, excluding the failed op
+                ["execute op0", "execute op1", "execute op2", "rollback op1", "rollback op0"],
+                id="failure-rolls-back",
+            ),
+            pytest.param(
+                "ok irreversible ok fail",
+                False,
+                ["execute op0", "execute op1", "execute op2", "execute op3"]
+                + ["rollback op2", "rollback op0"],
+                id="irreversible-not-rolled-back",
+            ),
+            pytest.param("ok ok", True, [], id="dry-run"),
+        ],
+    )
+    def test_scenario(self, kinds: str, dry_run: bool, expected_calls: list[str]):
+        """Test which operations execute and roll back, and in what order.
+
+        kinds lists one operation per word: ok, fail (raises on execute) or
+        irreversible (can_rollback = False).
+        """
+        calls = []
+        tm = TransactionManager(dry_run=dry_run)
+        for index, kind in enumerate(kinds.split()):
+            op_class = IrreversibleOp if kind == "irreversible" else RecordingOp
+            tm.add(op_class(f"op{index}", calls, fail=kind == "fail"))
 
         success, error, rollback_errors = tm.execute()
 
-        assert success is True
-        assert error is None
+        assert calls == expected_calls
         assert rollback_errors == []
-        assert executed == ["op1", "op2", "op3"]
-
-    def test_execute_rolls_back_on_failure(self):
-        """Test that execute rolls back completed operations on failure."""
-        executed = []
-        rolled_back = []
-
-        class MockOp(Operation):
-            def __init__(self, name: str, should_fail: bool = False):
-                super().__init__(name)
-                self.should_fail = should_fail
-
-            def execute(self):
-                executed.append(self.name)
-                if self.should_fail:
-                    raise RuntimeError(f"{self.name} failed")
-
-            def rollback(self):
-                rolled_back.append(self.name)
-
+        if "fail" in kinds.split():
+            assert success is False
+            assert f"op{kinds.split().index('fail')} failed" in error
+        else:
+            assert success is True
+            assert error is None
+
+    @pytest.mark.parametrize("failing", range(4))
+    def test_rolls_back_everything_before_the_failure(self, failing: int):
+        """Test that a failure at any position undoes exactly the operations before it."""
+        calls = []
         tm = TransactionManager()
-        tm.add(MockOp("op1"))
-        tm.add(MockOp("op2"))
-        tm.add(MockOp("op3", should_fail=True))
-        tm.add(MockOp("op4"))
+        for index in range(4):
+            tm.add(RecordingOp(f"op{index}", calls, fail=index == failing))
 
-        success, error, rollback_errors = tm.execute()
+        success, _, _ = tm.execute()
 
         assert success is False
-        assert "op3 failed" in error
-        assert executed == ["op1", "op2", "op3"]
-        # Rollback in reverse order, excluding failed op
-        assert rolled_back == ["op2", "op1"]
-
-    def test_dry_run_skips_execution(self):
-        """Test that dry_run mode skips actual execution."""
-        executed = []
-
-        class MockOp(Operation):
-            def __init__(self, name: str):
-                super().__init__(name)
-
-            def execute(self):
-                executed.append(self.name)
-
-            def rollback(self):
-                pass
-
-        tm = TransactionManager(dry_run=True)
-        tm.add(MockOp("op1"))
-        tm.add(MockOp("op2"))
-
-        success, error, rollback_errors = tm.execute()
-
-        assert success is True
-        assert error is None
-        assert executed == []
+        rolled_back = [call for call in calls if call.startswith("rollback")]
+        assert rolled_back == [f"rollback op{index}" for index in reversed(range(failing))]
 
     def test_progress_callback_is_called(self):
         """Test that progress callback is called for each operation."""
@@ -270,19 +330,9 @@ class TestTransactionManager:
         def progress_callback(name: str, status: str):
             progress_calls.append((name, status))
 
-        class MockOp(Operation):
-            def __init__(self, name: str):
-                super().__init__(name)
-
-            def execute(self):
-                pass
-
-            def rollback(self):
-                pass
-
         tm = TransactionManager(progress_callback=progress_callback)
-        tm.add(MockOp("op1"))
-        tm.add(MockOp("op2"))
+        tm.add(RecordingOp("op1"))
+        tm.add(RecordingOp("op2"))
 
         tm.execute()
 
@@ -291,90 +341,80 @@ class TestTransactionManager:
         assert ("op2", "starting") in progress_calls
         assert ("op2", "completed") in progress_calls
 
-    def test_rollback_skips_non_rollbackable_operations(self):
-        """Test that rollback skips operations that can't be rolled back."""
-        rolled_back = []
-
-        class RollbackableOp(Operation):
-            def __init__(self, name: str):
-                super().__init__(name)
-
-            def execute(self):
-                pass
-
-            def rollback(self):
-                rolled_back.append(self.name)
-
-            def can_rollback(self):
-                return True
-
-        class NonRollbackableOp(Operation):
-            def __init__(self, name: str):
-                super().__init__(name)
-
-            def execute(self):
-                pass
-
-            def rollback(self):
-                rolled_back.append(self.name)
-
-            def can_rollback(self):
-                return False
+    def test_rollback_errors_are_collected(self):
+        """Test that rollback errors are collected and returned."""
+        tm = TransactionManager()
+        tm.add(RecordingOp("op1", fail_rollback=True))
+        tm.add(RecordingOp("op2", fail_rollback=True))
+        tm.add(RecordingOp("op3", fail=True))
 
-        class FailingOp(Operation):
-            def __init__(self, name: str):
-                super().__init__(name)
+        success, error, rollback_errors = tm.execute()
 
+        assert success is False
+        assert rollback_errors == [
+            "op2: rollback of op2 failed",
+            "op1: rollback of op1 failed",
+        ]
+
+    def test_state_flushed_once_on_success(self, tmp_path: Path):
+        """Test that state changes are written once, after the last operation."""
+        state_manager = StateManager(tmp_path)
+        worktree = WorktreeInfo(path=tmp_path / "wt", branch="test-branch")
+        writes_seen: list[bool] = []
+
+        class CheckStateOp(Operation):
             def execute(self):
-                raise RuntimeError("fail")
+                writes_seen.append(state_manager.state_path.exists())
 
             def rollback(self):
                 pass
 
-        tm = TransactionManager()
-        tm.add(RollbackableOp("op1"))
-        tm.add(NonRollbackableOp("op2"))
-        tm.add(RollbackableOp("op3"))
-        tm.add(FailingOp("op4"))
+        tm = TransactionManager(state_manager=state_manager)
+        tm.add(UpdateStateOperation(state_manager, "test-branch", worktree))
+        tm.add(CheckStateOp("check"))
 
-        tm.execute()
+        success, _, _ = tm.execute()
 
-        # op2 should not be rolled back because can_rollback() returns False
-        assert "op1" in rolled_back
-        assert "op2" not in rolled_back
-        assert "op3" in rolled_back
+        assert success is True
+        assert writes_seen == [False]
+        assert state_manager.dirty is False
+        assert StateManager(tmp_path).load().worktrees["test-branch"].branch == "test-branch"
 
-    def test_rollback_errors_are_collected(self):
-        """Test that rollback errors are collected and returned."""
+    def test_state_flushed_after_rollback(self, tmp_path: Path):
+        """Test that rolled back state changes never reach the state file."""
+        state_manager = StateManager(tmp_path)
+        worktree = WorktreeInfo(path=tmp_path / "wt", branch="test-branch")
 
-        class FailingRollbackOp(Operation):
-            def __init__(self, name: str):
-                super().__init__(name)
+        tm = TransactionManager(state_manager=state_manager)
+        tm.add(UpdateStateOperation(state_manager, "test-branch", worktree))
+        tm.add(RecordingOp("fail", fail=True))
 
-            def execute(self):
-                pass
+        success, _, _ = tm.execute()
 
-            def rollback(self):
-                raise RuntimeError(f"rollback of {self.name} failed")
+        assert success is False
+        assert state_manager.dirty is False
+        assert StateManager(tmp_path).load().worktrees == {}
 
-        class FailingOp(Operation):
-            def __init__(self, name: str):
-                super().__init__(name)
+    def test_skipped_operation_does_not_fail(self):
+        """Test that SkipOperation marks the operation skipped and continues."""
+        calls = []
+        reports = []
 
+        class SkippingOp(Operation):
             def execute(self):
-                raise RuntimeError("fail")
+                raise SkipOperation("nothing to do")
 
             def rollback(self):
                 pass
 
-        tm = TransactionManager()
-        tm.add(FailingRollbackOp("op1"))
-        tm.add(FailingRollbackOp("op2"))
-        tm.add(FailingOp("op3"))
+        skipping = SkippingOp("skip")
+        tm = TransactionManager(progress_callback=lambda name, status: reports.append(status))
+        tm.add(skipping)
+        tm.add(RecordingOp("after", calls))
 
-        success, error, rollback_errors = tm.execute()
+        success, _, _ = tm.execute()
 
-        assert success is False
-        assert len(rollback_errors) == 2
-        assert any("op1" in e for e in rollback_errors)
-        assert any("op2" in e for e in rollback_errors)
+        assert success is True
+        assert skipping.status == OperationStatus.SKIPPED
+        assert calls == ["execute after"]
+        assert reports[:2] == ["starting", "skipped"]
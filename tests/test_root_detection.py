@@ -1,7 +1,8 @@
 """Tests for root detection utilities."""
 
-import os
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -47,15 +48,45 @@ class TestFindMainRepoRoot:
         with pytest.raises(RootDetectionError, match="Not in a git repository"):
             find_main_repo_root(non_git_dir)
 
-    def test_uses_cwd_by_default(self, temp_git_repo: Path) -> None:
+    def test_uses_cwd_by_default(
+        self, temp_git_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Should use current working directory when no path provided."""
-        original_dir = os.getcwd()
-        try:
-            os.chdir(temp_git_repo)
-            result = find_main_repo_root()
-            assert result == temp_git_repo
-        finally:
-            os.chdir(original_dir)
+        monkeypatch.chdir(temp_git_repo)
+        result = find_main_repo_root()
+        assert result == temp_git_repo
+
+    def test_relative_path_follows_cwd(
+        self, temp_git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should not reuse a relative path's cached result after changing directory."""
+        non_git_dir = tmp_path / "not-a-repo"
+        non_git_dir.mkdir()
+
+        monkeypatch.chdir(temp_git_repo)
+        assert find_main_repo_root(Path(".")) == temp_git_repo
+        monkeypatch.chdir(non_git_dir)
+        with pytest.raises(RootDetectionError):
+            find_main_repo_root(Path("."))
+
+    def test_memoizes_per_directory(
+        self, temp_git_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should only run git once for repeated lookups from the same directory."""
+        import workgarden.utils.root as root_module
+
+        calls = []
+        real_run = root_module.subprocess.run
+
+        def counting_run(*args, **kwargs):
+            calls.append(args)
+            return real_run(*args, **kwargs)
+
+        monkeypatch.setattr(root_module.subprocess, "run", counting_run)
+
+        assert find_main_repo_root(temp_git_repo) == temp_git_repo
+        assert find_main_repo_root(temp_git_repo) == temp_git_repo
+        assert len(calls) == 1
 
 
 class TestIsInsideWorktree:
@@ -96,63 +127,61 @@ class TestIsInsideWorktree:
         with pytest.raises(RootDetectionError, match="Not in a git repository"):
             is_inside_worktree(non_git_dir)
 
-    def test_uses_cwd_by_default(self, temp_git_repo: Path) -> None:
+    def test_uses_cwd_by_default(
+        self, temp_git_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Should use current working directory when no path provided."""
-        original_dir = os.getcwd()
-        try:
-            os.chdir(temp_git_repo)
-            result = is_inside_worktree()
-            assert result is False
-        finally:
-            os.chdir(original_dir)
+        monkeypatch.chdir(temp_git_repo)
+        result = is_inside_worktree()
+        assert result is False
+
+    def test_shares_git_call_with_find_main_repo_root(
+        self, temp_git_repo_with_worktree: tuple[Path, Path]
+    ) -> None:
+        """Should answer both questions from a single git rev-parse call."""
+        _main_repo, worktree = temp_git_repo_with_worktree
+        subdir = worktree / "single-call"
+        subdir.mkdir()
+        with patch("workgarden.utils.root.subprocess.run", wraps=subprocess.run) as run:
+            assert is_inside_worktree(subdir) is True
+            find_main_repo_root(subdir)
+        assert run.call_count == 1
 
 
 class TestIntegration:
     """Integration tests for root detection with config/state managers."""
 
     def test_config_loader_from_worktree(
-        self, temp_git_repo_with_worktree: tuple[Path, Path]
+        self, temp_git_repo_with_worktree: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """ConfigLoader should find config from worktree."""
         from workgarden.config.loader import ConfigLoader
 
         main_repo, worktree = temp_git_repo_with_worktree
-        original_dir = os.getcwd()
-        try:
-            os.chdir(worktree)
-            loader = ConfigLoader()
-            assert loader.root_path == main_repo
-            assert loader.config_path == main_repo / ".workgarden.yaml"
-        finally:
-            os.chdir(original_dir)
+        monkeypatch.chdir(worktree)
+        loader = ConfigLoader()
+        assert loader.root_path == main_repo
+        assert loader.config_path == main_repo / ".workgarden.yaml"
 
     def test_state_manager_from_worktree(
-        self, temp_git_repo_with_worktree: tuple[Path, Path]
+        self, temp_git_repo_with_worktree: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """StateManager should use main repo from worktree."""
         from workgarden.models.state import StateManager
 
         main_repo, worktree = temp_git_repo_with_worktree
-        original_dir = os.getcwd()
-        try:
-            os.chdir(worktree)
-            manager = StateManager()
-            assert manager.root_path == main_repo
-            assert manager.state_path == main_repo / ".workgarden.state.json"
-        finally:
-            os.chdir(original_dir)
+        monkeypatch.chdir(worktree)
+        manager = StateManager()
+        assert manager.root_path == main_repo
+        assert manager.state_path == main_repo / ".workgarden.state.json"
 
     def test_worktree_manager_from_worktree(
-        self, temp_git_repo_with_worktree: tuple[Path, Path]
+        self, temp_git_repo_with_worktree: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """WorktreeManager should use main repo from worktree."""
         from workgarden.core.worktree import WorktreeManager
 
         main_repo, worktree = temp_git_repo_with_worktree
-        original_dir = os.getcwd()
-        try:
-            os.chdir(worktree)
-            manager = WorktreeManager()
-            assert manager.root_path == main_repo
-        finally:
-            os.chdir(original_dir)
+        monkeypatch.chdir(worktree)
+        manager = WorktreeManager()
+        assert manager.root_path == main_repo
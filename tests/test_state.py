@@ -0,0 +1,169 @@
+"""Tests for state persistence."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from workgarden.exceptions import StateError
+from workgarden.models import state as state_module
+from workgarden.models.state import StateManager, WorkgardenState
+from workgarden.models.worktree import WorktreeInfo
+
+
+def _worktree(branch: str, **ports: int) -> WorktreeInfo:
+    return WorktreeInfo(path=Path(f"/tmp/{branch}"), branch=branch, port_mappings=ports)
+
+
+class TestWorkgardenState:
+    """Tests for WorkgardenState serialization."""
+
+    def test_allocated_ports_serialized_sorted(self):
+        """Should write allocated ports as a sorted JSON list."""
+        state = WorkgardenState(allocated_ports={8002, 8000, 8001})
+
+        assert state.to_dict()["allocated_ports"] == [8000, 8001, 8002]
+
+    def test_from_dict_dedupes_ports(self):
+        """Should load allocated ports from a list into a set."""
+        state = WorkgardenState.from_dict({"allocated_ports": [8000, 8000, 8001]})
+
+        assert state.allocated_ports == {8000, 8001}
+
+
+class TestWorktreeInfo:
+    """Tests for WorktreeInfo serialization."""
+
+    def test_dict_round_trip(self):
+        """Should rebuild an equal WorktreeInfo from its dict form."""
+        worktree = _worktree("feature/x", web=8000)
+
+        data = worktree.to_dict()
+
+        assert data["path"] == "/tmp/feature/x"
+        assert WorktreeInfo.from_dict(data) == worktree
+
+    def test_slug_matches_get_branch_slug(self):
+        """Should compute the slug with the same helper WorktreeManager uses."""
+        assert _worktree("Feature/My_Branch").slug == "feature-my-branch"
+
+    def test_uses_slots(self):
+        """Should not carry a per-instance __dict__."""
+        assert not hasattr(_worktree("a"), "__dict__")
+
+
+class TestStateManager:
+    """Tests for StateManager port bookkeeping."""
+
+    def test_add_and_remove_worktree_ports(self, tmp_path: Path):
+        """Should allocate ports on add and release them on remove."""
+        manager = StateManager(tmp_path)
+        manager.add_worktree("a", _worktree("a", web=8000, db=8001))
+        manager.add_worktree("b", _worktree("b", web=8002))
+
+        assert manager.is_port_allocated(8001)
+
+        manager.remove_worktree("a")
+        manager.flush()
+
+        assert manager.state.allocated_ports == {8002}
+        saved = json.loads(manager.state_path.read_text())
+        assert saved["allocated_ports"] == [8002]
+
+    def test_state_round_trip(self, tmp_path: Path):
+        """Should reload the saved worktrees and ports."""
+        manager = StateManager(tmp_path)
+        manager.add_worktree("a", _worktree("a", web=8000))
+        manager.flush()
+
+        state = StateManager(tmp_path).load()
+
+        assert state.allocated_ports == {8000}
+        assert state.worktrees["a"].branch == "a"
+
+    def test_mutations_deferred_until_flush(self, tmp_path: Path):
+        """Should not touch the state file until flush() is called."""
+        manager = StateManager(tmp_path)
+        manager.add_worktree("a", _worktree("a"))
+
+        assert manager.dirty is True
+        assert not manager.state_path.exists()
+
+        manager.flush()
+
+        assert manager.dirty is False
+        assert manager.state_path.exists()
+
+    def test_flush_without_changes_is_noop(self, tmp_path: Path):
+        """Should not write the state file when nothing changed."""
+        manager = StateManager(tmp_path)
+        manager.flush()
+
+        assert not manager.state_path.exists()
+
+    def test_save_is_compact_and_leaves_no_temp_file(self, tmp_path: Path):
+        """Should write compact JSON via an atomic rename."""
+        manager = StateManager(tmp_path)
+        manager.add_worktree("a", _worktree("a", web=8000))
+        manager.save()
+
+        assert "\n" not in manager.state_path.read_text()
+        assert list(tmp_path.iterdir()) == [manager.state_path]
+
+    def test_find_slug_by_branch_tracks_mutations(self, tmp_path: Path):
+        """Should keep the branch index in sync with adds and removes."""
+        manager = StateManager(tmp_path)
+        manager.add_worktree("custom-slug", _worktree("feature/a"))
+
+        assert manager.find_slug_by_branch("feature/a") == "custom-slug"
+        assert manager.find_slug_by_branch("feature/b") is None
+
+        manager.add_worktree("b", _worktree("feature/b"))
+        manager.remove_worktree("custom-slug")
+
+        assert manager.find_slug_by_branch("feature/a") is None
+        assert manager.find_slug_by_branch("feature/b") == "b"
+
+    def test_save_without_orjson(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Should write the same bytes with the stdlib encoder."""
+        manager = StateManager(tmp_path)
+        manager.add_worktree("a", _worktree("a", web=8000))
+        manager.save()
+        with_orjson = manager.state_path.read_bytes()
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        manager.save()
+
+        assert manager.state_path.read_bytes() == with_orjson
+
+    def test_load_via_mmap(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Should parse state files above the mmap threshold."""
+        manager = StateManager(tmp_path)
+        manager.add_worktree("a", _worktree("a", web=8000))
+        manager.save()
+        monkeypatch.setattr(state_module, "MMAP_THRESHOLD", 1)
+
+        assert StateManager(tmp_path).load().allocated_ports == {8000}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_invalid_json_raises_state_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ):
+        """Should raise StateError for a corrupt state file with either parser."""
+        if not use_orjson:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        manager = StateManager(tmp_path)
+        manager.state_path.write_text("{not json")
+
+        with pytest.raises(StateError):
+            manager.load()
+
+    @pytest.mark.parametrize("content", ['{"worktrees": []}', '{"worktrees": {"x": 1}}'])
+    def test_malformed_state_raises_state_error(self, tmp_path: Path, content: str):
+        """Should raise StateError for valid JSON with the wrong structure."""
+        manager = StateManager(tmp_path)
+        manager.state_path.write_text(content)
+
+        with pytest.raises(StateError):
+            manager.load()
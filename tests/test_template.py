@@ -0,0 +1,73 @@
+"""Tests for template variable substitution."""
+
+from pathlib import Path
+
+from workgarden.utils.template import (
+    TemplateContext,
+    substitute_path_variables,
+    substitute_variables,
+)
+
+
+class TestSubstituteVariables:
+    """Tests for {{VARIABLE}} substitution."""
+
+    def test_substitutes_known_variables(self, tmp_path: Path):
+        """Known variables are replaced."""
+        context = TemplateContext(
+            branch="feature/x", branch_slug="feature-x", worktree_path=tmp_path, repo_name="app"
+        )
+
+        result = substitute_variables("{{REPO_NAME}}:{{BRANCH}} in {{WORKTREE_PATH}}", context)
+
+        assert result == f"app:feature/x in {tmp_path}"
+
+    def test_unknown_variables_are_kept(self):
+        """Unknown placeholders are left untouched."""
+        context = TemplateContext(branch="main")
+
+        assert substitute_variables("{{NOPE}} {{BRANCH}}", context) == "{{NOPE}} main"
+
+    def test_port_and_custom_variables(self):
+        """Port mappings and custom variables are available."""
+        context = TemplateContext(port_mappings={"web": 8080}, custom_variables={"ENV": "dev"})
+
+        assert substitute_variables("{{PORT_WEB}}-{{ENV}}", context) == "8080-dev"
+
+
+class TestTemplateContextSubstitutions:
+    """Tests for the cached substitutions dict."""
+
+    def test_substitutions_are_cached(self):
+        """Repeated access returns the same dict."""
+        context = TemplateContext(branch="main")
+
+        assert context.substitutions is context.substitutions
+
+    def test_assignment_invalidates_cache(self):
+        """Assigning an attribute refreshes the variables."""
+        context = TemplateContext(branch="main")
+        assert context.substitutions["BRANCH"] == "main"
+
+        context.branch = "develop"
+
+        assert context.substitutions["BRANCH"] == "develop"
+
+
+class TestSubstitutePathVariables:
+    """Tests for {variable} path substitution."""
+
+    def test_substitutes_path_variables(self):
+        """Lowercase path variables are replaced."""
+        context = TemplateContext(branch="feature/x", branch_slug="feature-x", repo_name="app")
+
+        result = substitute_path_variables("../{repo_name}-worktrees/{branch_slug}", context)
+
+        assert result == "../app-worktrees/feature-x"
+
+    def test_unknown_and_literal_paths_are_kept(self):
+        """Unknown placeholders and placeholder-free paths pass through unchanged."""
+        context = TemplateContext(branch="main", branch_slug="main", repo_name="app")
+
+        assert substitute_path_variables("../{nope}/{branch}", context) == "../{nope}/main"
+        assert substitute_path_variables("../worktrees", context) == "../worktrees"
@@ -3,35 +3,60 @@
 import subprocess
 from pathlib import Path
 
+import pytest
+
+from tests.fakes import FakeGitUtils
 from workgarden.core.worktree import CreateOptions, RemoveOptions, WorktreeManager
+from workgarden.models.state import StateManager
 from workgarden.models.worktree import WorktreeInfo
+from workgarden.utils.git import GitUtils
+
+
+def _create_branch(repo: Path, branch: str) -> None:
+    """Create a local branch at HEAD through git, whatever the ref backend."""
+    subprocess.run(
+        ["git", "update-ref", f"refs/heads/{branch}", "HEAD"],
+        cwd=repo,
+        capture_output=True,
+        check=True,
+    )
 
 
 class TestWorktreeManagerCreate:
     """Tests for WorktreeManager.create()."""
 
+    @pytest.mark.slow
     def test_create_worktree_new_branch(self, temp_git_repo_with_config: Path):
-        """Test creating a worktree with a new branch."""
-        manager = WorktreeManager(root_path=temp_git_repo_with_config)
-        options = CreateOptions(branch="feature-test")
+        """Test creating a worktree with a new branch at the configured path."""
+        progress_calls = []
+
+        def callback(name: str, status: str):
+            progress_calls.append((name, status))
+
+        manager = WorktreeManager(
+            root_path=temp_git_repo_with_config,
+            progress_callback=callback,
+        )
+        options = CreateOptions(branch="feature/my-feature")
 
         result = manager.create(options)
 
         assert result.success is True
         assert result.worktree is not None
-        assert result.worktree.branch == "feature-test"
+        assert result.worktree.branch == "feature/my-feature"
         assert result.worktree.path.exists()
-        assert manager.state.get_worktree("feature-test") is not None
+        assert manager.state.get_worktree("feature-my-feature") is not None
+        # Path comes from worktree_base_path and the branch slug in the config
+        worktrees_dir = temp_git_repo_with_config.parent / "test-repo-worktrees"
+        assert result.worktree.path == worktrees_dir / "feature-my-feature"
+        # Progress is reported as operations start and complete
+        statuses = {status for _name, status in progress_calls}
+        assert {"starting", "completed"} <= statuses
 
+    @pytest.mark.slow
     def test_create_worktree_existing_branch(self, temp_git_repo_with_config: Path):
         """Test creating a worktree with an existing branch."""
-        # Create a branch first
-        subprocess.run(
-            ["git", "branch", "existing-branch"],
-            cwd=temp_git_repo_with_config,
-            capture_output=True,
-            check=True,
-        )
+        _create_branch(temp_git_repo_with_config, "existing-branch")
 
         manager = WorktreeManager(root_path=temp_git_repo_with_config)
         options = CreateOptions(branch="existing-branch")
@@ -42,6 +67,7 @@ class TestWorktreeManagerCreate:
         assert result.worktree.branch == "existing-branch"
         assert result.worktree.path.exists()
 
+    @pytest.mark.slow
     def test_create_worktree_duplicate_fails(self, temp_git_repo_with_config: Path):
         """Test that creating a duplicate worktree fails."""
         manager = WorktreeManager(root_path=temp_git_repo_with_config)
@@ -66,21 +92,9 @@ class TestWorktreeManagerCreate:
         # Worktree should not actually exist
         assert manager.state.get_worktree("feature-dry") is None
 
-    def test_create_worktree_calculates_correct_path(self, temp_git_repo_with_config: Path):
-        """Test that worktree path is calculated correctly from config."""
-        manager = WorktreeManager(root_path=temp_git_repo_with_config)
-        options = CreateOptions(branch="feature/my-feature")
-
-        result = manager.create(options)
-
-        assert result.success is True
-        # Branch slug should be feature-my-feature
-        worktrees_dir = temp_git_repo_with_config.parent / "test-repo-worktrees"
-        expected_path = worktrees_dir / "feature-my-feature"
-        assert result.worktree.path == expected_path
-
-    def test_create_worktree_with_progress_callback(self, temp_git_repo_with_config: Path):
-        """Test that progress callback is called."""
+    @pytest.mark.slow
+    def test_create_worktree_skip_hooks(self, temp_git_repo_with_config: Path):
+        """Test that skip_hooks option works."""
         progress_calls = []
 
         def callback(name: str, status: str):
@@ -90,40 +104,74 @@ class TestWorktreeManagerCreate:
             root_path=temp_git_repo_with_config,
             progress_callback=callback,
         )
-        options = CreateOptions(branch="feature-test")
+        options = CreateOptions(branch="feature-test", skip_hooks=True)
 
         result = manager.create(options)
 
         assert result.success is True
-        assert len(progress_calls) > 0
-        # Check that we got starting and completed for operations
-        assert any("starting" in call[1] for call in progress_calls)
-        assert any("completed" in call[1] for call in progress_calls)
+        # No "Run ... hooks" operations should be present
+        hook_calls = [c for c in progress_calls if "hooks" in c[0].lower()]
+        assert len(hook_calls) == 0
 
-    def test_create_worktree_skip_hooks(self, temp_git_repo_with_config: Path):
-        """Test that skip_hooks option works."""
-        progress_calls = []
+    @pytest.mark.slow
+    def test_repo_name_looked_up_once(self, temp_git_repo_with_config: Path, monkeypatch):
+        """Test that create and remove share one repo name lookup."""
+        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+        calls = []
+        lookup = manager.git._lookup_repo_name
 
-        def callback(name: str, status: str):
-            progress_calls.append((name, status))
+        def counting_lookup():
+            calls.append(1)
+            return lookup()
+
+        monkeypatch.setattr(manager.git, "_lookup_repo_name", counting_lookup)
+
+        manager.create(CreateOptions(branch="feature-name"))
+        manager.remove(RemoveOptions(branch="feature-name"))
 
+        assert len(calls) == 1
+        assert manager.repo_name == "test-repo"
+
+    @pytest.mark.slow
+    def test_create_omits_empty_hook_operations(self, temp_git_repo_with_config: Path):
+        """Test that hook events with no configured hooks add no operations."""
+        progress_calls = []
         manager = WorktreeManager(
             root_path=temp_git_repo_with_config,
-            progress_callback=callback,
+            progress_callback=lambda name, status: progress_calls.append(name),
         )
-        options = CreateOptions(branch="feature-test", skip_hooks=True)
 
-        result = manager.create(options)
+        result = manager.create(CreateOptions(branch="feature-empty"))
 
         assert result.success is True
-        # No "Run ... hooks" operations should be present
-        hook_calls = [c for c in progress_calls if "hooks" in c[0].lower()]
-        assert len(hook_calls) == 0
+        assert not [name for name in progress_calls if name.startswith("Run ")]
+
+    @pytest.mark.slow
+    def test_config_loaded_once_per_manager(self, temp_git_repo_with_config: Path, monkeypatch):
+        """Test that repeated operations reuse the loaded config."""
+        from workgarden.config.loader import ConfigLoader
+
+        loads = []
+        load = ConfigLoader.load
+
+        def counting_load(self):
+            loads.append(1)
+            return load(self)
+
+        monkeypatch.setattr(ConfigLoader, "load", counting_load)
+        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+
+        manager.create(CreateOptions(branch="feature-one"))
+        manager.create(CreateOptions(branch="feature-two"))
+        manager.remove(RemoveOptions(branch="feature-one"))
+
+        assert len(loads) == 1
 
 
 class TestWorktreeManagerRemove:
     """Tests for WorktreeManager.remove()."""
 
+    @pytest.mark.slow
     def test_remove_worktree(self, temp_git_repo_with_config: Path):
         """Test removing a worktree."""
         manager = WorktreeManager(root_path=temp_git_repo_with_config)
@@ -149,6 +197,7 @@ class TestWorktreeManagerRemove:
         assert result.success is False
         assert "not found" in result.error.lower()
 
+    @pytest.mark.slow
     def test_remove_worktree_with_uncommitted_changes_fails(
         self, temp_git_repo_with_config: Path
     ):
@@ -168,6 +217,7 @@ class TestWorktreeManagerRemove:
         assert remove_result.success is False
         assert "uncommitted" in remove_result.error.lower()
 
+    @pytest.mark.slow
     def test_remove_worktree_force_with_uncommitted_changes(
         self, temp_git_repo_with_config: Path
     ):
@@ -188,6 +238,7 @@ class TestWorktreeManagerRemove:
         assert remove_result.success is True
         assert not worktree_path.exists()
 
+    @pytest.mark.slow
     def test_remove_worktree_keep_branch(self, temp_git_repo_with_config: Path):
         """Test removing worktree but keeping branch."""
         manager = WorktreeManager(root_path=temp_git_repo_with_config)
@@ -204,14 +255,9 @@ class TestWorktreeManagerRemove:
         assert remove_result.success is True
 
         # Branch should still exist
-        result = subprocess.run(
-            ["git", "branch", "--list", "feature-keep"],
-            cwd=temp_git_repo_with_config,
-            capture_output=True,
-            text=True,
-        )
-        assert "feature-keep" in result.stdout
+        assert GitUtils(temp_git_repo_with_config).branch_exists("feature-keep")
 
+    @pytest.mark.slow
     def test_remove_worktree_deletes_branch(self, temp_git_repo_with_config: Path):
         """Test removing worktree also deletes branch by default."""
         manager = WorktreeManager(root_path=temp_git_repo_with_config)
@@ -219,6 +265,7 @@ class TestWorktreeManagerRemove:
         # Create worktree
         create_result = manager.create(CreateOptions(branch="feature-delete"))
         assert create_result.success is True
+        assert GitUtils(temp_git_repo_with_config).branch_exists("feature-delete")
 
         # Remove (should delete branch too)
         remove_result = manager.remove(RemoveOptions(branch="feature-delete"))
@@ -226,13 +273,43 @@ class TestWorktreeManagerRemove:
         assert remove_result.success is True
 
         # Branch should be deleted
-        result = subprocess.run(
-            ["git", "branch", "--list", "feature-delete"],
-            cwd=temp_git_repo_with_config,
-            capture_output=True,
-            text=True,
+        assert not GitUtils(temp_git_repo_with_config).branch_exists("feature-delete")
+
+    @pytest.mark.slow
+    def test_remove_stops_when_pre_remove_hook_fails(self, temp_git_repo_with_config: Path):
+        """Test that a failing pre_remove hook leaves the worktree in place."""
+        config_path = temp_git_repo_with_config / ".workgarden.yaml"
+        config_path.write_text(
+            config_path.read_text().replace("pre_remove: []", 'pre_remove: ["exit 3"]')
         )
-        assert "feature-delete" not in result.stdout
+        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+        create_result = manager.create(CreateOptions(branch="feature-pre"))
+
+        remove_result = manager.remove(RemoveOptions(branch="feature-pre"))
+
+        assert remove_result.success is False
+        assert create_result.worktree.path.exists()
+        assert manager.state.get_worktree("feature-pre") is not None
+
+    @pytest.mark.slow
+    def test_remove_warns_when_post_remove_hook_fails(self, temp_git_repo_with_config: Path):
+        """Test that a failing post_remove hook is reported as skipped."""
+        config_path = temp_git_repo_with_config / ".workgarden.yaml"
+        config_path.write_text(
+            config_path.read_text().replace("post_remove: []", 'post_remove: ["exit 3"]')
+        )
+        progress_calls = []
+        manager = WorktreeManager(
+            root_path=temp_git_repo_with_config,
+            progress_callback=lambda name, status: progress_calls.append((name, status)),
+        )
+        manager.create(CreateOptions(branch="feature-post"))
+
+        remove_result = manager.remove(RemoveOptions(branch="feature-post"))
+
+        assert remove_result.success is True
+        assert ("Run post_remove hooks", "skipped") in progress_calls
+        assert StateManager(temp_git_repo_with_config).load().worktrees == {}
 
 
 class TestWorktreeManagerList:
@@ -246,9 +323,9 @@ class TestWorktreeManagerList:
 
         assert result == {}
 
-    def test_list_with_worktrees(self, temp_git_repo_with_config: Path):
+    def test_list_with_worktrees(self, fake_git: FakeGitUtils):
         """Test listing multiple worktrees."""
-        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+        manager = WorktreeManager(root_path=fake_git.repo_path)
 
         # Create worktrees
         manager.create(CreateOptions(branch="feature-one"))
@@ -263,9 +340,33 @@ class TestWorktreeManagerList:
         assert result["feature-two"].branch == "feature-two"
 
 
+class TestWorktreeManagerFindByBranch:
+    """Tests for WorktreeManager.find_by_branch()."""
+
+    @pytest.mark.slow
+    def test_find_by_slug_and_branch(self, temp_git_repo_with_config: Path):
+        """Test lookup by slug and by exact branch name."""
+        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+        manager.create(CreateOptions(branch="feature/Find_Me"))
+
+        by_branch = manager.find_by_branch("feature/Find_Me")
+        by_slug = manager.find_by_branch("feature-find-me")
+
+        assert by_branch is not None
+        assert by_branch[0] == "feature-find-me"
+        assert by_slug == by_branch
+
+    def test_find_missing_returns_none(self, temp_git_repo_with_config: Path):
+        """Test lookup of an unknown branch."""
+        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+
+        assert manager.find_by_branch("nope") is None
+
+
 class TestWorktreeManagerStatus:
     """Tests for WorktreeManager.get_worktree_status()."""
 
+    @pytest.mark.slow
     def test_status_ok(self, temp_git_repo_with_config: Path):
         """Test status is OK for clean worktree."""
         manager = WorktreeManager(root_path=temp_git_repo_with_config)
@@ -277,6 +378,7 @@ class TestWorktreeManagerStatus:
 
         assert status == "OK"
 
+    @pytest.mark.slow
     def test_status_modified(self, temp_git_repo_with_config: Path):
         """Test status is Modified for dirty worktree."""
         manager = WorktreeManager(root_path=temp_git_repo_with_config)
@@ -291,6 +393,7 @@ class TestWorktreeManagerStatus:
 
         assert status == "Modified"
 
+    @pytest.mark.slow
     def test_status_missing(self, temp_git_repo_with_config: Path):
         """Test status is Missing for deleted directory."""
         manager = WorktreeManager(root_path=temp_git_repo_with_config)
@@ -298,10 +401,9 @@ class TestWorktreeManagerStatus:
         create_result = manager.create(CreateOptions(branch="feature-missing"))
         assert create_result.success is True
 
-        # Manually delete the directory (simulating corruption)
-        import shutil
-
-        shutil.rmtree(create_result.worktree.path)
+        # Move the directory away (simulating a manual delete); tmp_path cleans it up
+        path = create_result.worktree.path
+        path.rename(path.with_name(f"{path.name}.gone"))
 
         # Create a new WorktreeInfo with the same path to test status
         worktree_info = WorktreeInfo(
@@ -312,3 +414,39 @@ class TestWorktreeManagerStatus:
         status = manager.get_worktree_status(worktree_info)
 
         assert status == "Missing"
+
+    @pytest.mark.slow
+    def test_statuses_for_multiple_worktrees(self, temp_git_repo_with_config: Path):
+        """Test batch status lookup returns a status per slug."""
+        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+
+        clean = manager.create(CreateOptions(branch="feature-clean"))
+        dirty = manager.create(CreateOptions(branch="feature-dirty"))
+        (dirty.worktree.path / "new_file.txt").write_text("changes")
+
+        statuses = manager.get_worktree_statuses(manager.list())
+
+        assert clean.success is True
+        assert statuses == {"feature-clean": "OK", "feature-dirty": "Modified"}
+
+    def test_statuses_empty(self, temp_git_repo_with_config: Path):
+        """Test batch status lookup with no worktrees."""
+        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+
+        assert manager.get_worktree_statuses({}) == {}
+
+    @pytest.mark.slow
+    def test_list_with_status(self, temp_git_repo_with_config: Path):
+        """Test listing worktrees paired with their statuses."""
+        manager = WorktreeManager(root_path=temp_git_repo_with_config)
+        ok = manager.create(CreateOptions(branch="feature-ok"))
+        gone = manager.create(CreateOptions(branch="feature-gone"))
+        gone_path = gone.worktree.path
+        gone_path.rename(gone_path.with_name(f"{gone_path.name}.gone"))
+
+        listing = manager.list_with_status()
+
+        assert listing == {
+            "feature-ok": (ok.worktree, "OK"),
+            "feature-gone": (gone.worktree, "Missing"),
+        }